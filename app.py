@@ -1,6 +1,7 @@
 from flask import Flask, render_template, request, jsonify, session
 from flask_socketio import SocketIO, emit, join_room, leave_room
 import uuid
+from operator import itemgetter
 from typing import Dict, Optional
 import json
 import threading
@@ -9,6 +10,7 @@ import time
 from pikomino import (
     Player,
     PikominoGame,
+    Dice,
     DiceValue,
     TurnResult,
     TurnState,
@@ -177,8 +179,8 @@ def create_game():
             strategy = create_strategy(strategy_type)
             players.append(Player(name, strategy))
 
-    # Créer la partie
-    game = PikominoGame(players)
+    # Créer la partie (l'interface affiche le détail des lancers)
+    game = PikominoGame(players, record_history=True)
     game_id = str(uuid.uuid4())
     games[game_id] = game
     game_modes[game_id] = mode
@@ -246,7 +248,7 @@ def get_available_tiles(game_id, score):
         {
             "center_tiles": center_tiles,
             "stealable_tiles": stealable_tiles,
-            "best_center_tile": max(center_tiles, key=lambda t: t["value"])
+            "best_center_tile": max(center_tiles, key=itemgetter("value"))
             if center_tiles
             else None,
             "stealable_available": len(stealable_tiles) > 0,
@@ -420,10 +422,8 @@ def on_roll_dice(data):
         return
 
     # Simuler le lancement de dés
-    from pikomino import Dice
-
     remaining_dice = data.get("remaining_dice", 8)
-    roll = [Dice.roll() for _ in range(remaining_dice)]
+    roll = Dice.roll_many(remaining_dice)
 
     # Créer ou mettre à jour l'état du tour
     if not current_player.strategy.current_turn_state:
@@ -485,14 +485,7 @@ def on_choose_dice_value(data):
             return
 
         # Mettre à jour l'état du tour
-        count = turn_state.current_roll.count(dice_value)
-        if dice_value in turn_state.reserved_dice:
-            turn_state.reserved_dice[dice_value] += count
-        else:
-            turn_state.reserved_dice[dice_value] = count
-
-        turn_state.used_values.add(dice_value)
-        turn_state.remaining_dice -= count
+        count = turn_state.reserve(dice_value)
 
         # Préparer les détails du tour
         turn_details = {
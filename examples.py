@@ -20,10 +20,17 @@ from strategies import (
     OptimalStrategy,
     GameContext
 )
+from pikomino_rules import POINT_VALUE
 from typing import Optional, List
 import statistics
 import random
 
+# Stratégies sans état partagées par tous les joueurs des simulations
+_CONSERVATIVE_SINGLETON = ConservativeStrategy()
+_AGGRESSIVE_SINGLETON = AggressiveStrategy()
+_BALANCED_SINGLETON = BalancedStrategy()
+_OPTIMAL_SINGLETON = OptimalStrategy()
+
 
 
 
@@ -62,9 +69,9 @@ def compare_strategies():
     print("=== Comparaison des stratégies ===\n")
 
     strategies = {
-        "Conservative": ConservativeStrategy(),
-        "Aggressive": AggressiveStrategy(),
-        "Balanced": BalancedStrategy(),
+        "Conservative": _CONSERVATIVE_SINGLETON,
+        "Aggressive": _AGGRESSIVE_SINGLETON,
+        "Balanced": _BALANCED_SINGLETON,
         "WormFocused": WormFocusedStrategy(),
     }
 
@@ -81,7 +88,7 @@ def compare_strategies():
         for _ in range(num_games):
             # Créer une partie avec la stratégie testée et deux stratégies conservatrices
             player_names = [strategy_name, "Conservative1", "Conservative2"]
-            game_strategies = [strategy, ConservativeStrategy(), ConservativeStrategy()]
+            game_strategies = [strategy, _CONSERVATIVE_SINGLETON, _CONSERVATIVE_SINGLETON]
 
             result = simulate_game(player_names, game_strategies)
 
@@ -119,9 +126,9 @@ def test_strategy_vs_strategy():
     print("\n=== Duels de stratégies ===\n")
 
     matchups = [
-        ("Conservative", ConservativeStrategy(), "Aggressive", AggressiveStrategy()),
-        ("Balanced", BalancedStrategy(), "Conservative", ConservativeStrategy()),
-        ("WormFocused", WormFocusedStrategy(), "Aggressive", AggressiveStrategy()),
+        ("Conservative", _CONSERVATIVE_SINGLETON, "Aggressive", _AGGRESSIVE_SINGLETON),
+        ("Balanced", _BALANCED_SINGLETON, "Conservative", _CONSERVATIVE_SINGLETON),
+        ("WormFocused", WormFocusedStrategy(), "Aggressive", _AGGRESSIVE_SINGLETON),
     ]
 
     num_games = 50
@@ -156,9 +163,9 @@ def simulate_detailed_game():
     print("\n=== Simulation détaillée d'une partie ===\n")
 
     players = [
-        Player("Alice", ConservativeStrategy()),
-        Player("Bob", AggressiveStrategy()),
-        Player("Charlie", BalancedStrategy()),
+        Player("Alice", _CONSERVATIVE_SINGLETON),
+        Player("Bob", _AGGRESSIVE_SINGLETON),
+        Player("Charlie", _BALANCED_SINGLETON),
     ]
 
     game = PikominoGame(players)
@@ -224,9 +231,9 @@ def analyze_game_length():
 
     for _ in range(num_games):
         players = [
-            Player("P1", ConservativeStrategy()),
-            Player("P2", AggressiveStrategy()),
-            Player("P3", BalancedStrategy()),
+            Player("P1", _CONSERVATIVE_SINGLETON),
+            Player("P2", _AGGRESSIVE_SINGLETON),
+            Player("P3", _BALANCED_SINGLETON),
         ]
 
         game = PikominoGame(players)
@@ -253,9 +260,9 @@ def demo_new_strategies():
     
     # Créer des joueurs avec différentes stratégies
     players = [
-        ("Conservative", ConservativeStrategy()),
-        ("Aggressive", AggressiveStrategy()),
-        ("Balanced", BalancedStrategy()),
+        ("Conservative", _CONSERVATIVE_SINGLETON),
+        ("Aggressive", _AGGRESSIVE_SINGLETON),
+        ("Balanced", _BALANCED_SINGLETON),
         ("TargetHigh", TargetedStrategy(min_target_value=30)),
         ("TargetPlayer", TargetedStrategy(target_player_name="Conservative")),
     ]
@@ -340,7 +347,7 @@ def demo_targeted_strategy():
     target_high = TargetedStrategy(min_target_value=32)
     
     players = [
-        ("Alice", ConservativeStrategy()),
+        ("Alice", _CONSERVATIVE_SINGLETON),
         ("Hunter", target_alice),  # Cible Alice
         ("HighSeeker", target_high),  # Vise les tuiles 32+
     ]
@@ -369,7 +376,7 @@ def demo_random_strategy():
         ("Random50", RandomStrategy(continue_probability=0.5), "50% chance de continuer"),
         ("RandomCautious", RandomStrategy(continue_probability=0.3), "30% chance de continuer (prudent)"),
         ("RandomRisky", RandomStrategy(continue_probability=0.7), "70% chance de continuer (risqué)"),
-        ("Conservative", ConservativeStrategy(), "Stratégie conservatrice (comparaison)"),
+        ("Conservative", _CONSERVATIVE_SINGLETON, "Stratégie conservatrice (comparaison)"),
     ]
     
     print("Stratégies testées:")
@@ -414,10 +421,10 @@ def test_random_vs_strategies():
     print("=" * 35)
     
     matchups = [
-        ("Random", RandomStrategy(), "Conservative", ConservativeStrategy()),
-        ("Random", RandomStrategy(), "Aggressive", AggressiveStrategy()),
-        ("Random", RandomStrategy(), "Balanced", BalancedStrategy()),
-        ("RandomRisky", RandomStrategy(0.8), "Conservative", ConservativeStrategy()),
+        ("Random", RandomStrategy(), "Conservative", _CONSERVATIVE_SINGLETON),
+        ("Random", RandomStrategy(), "Aggressive", _AGGRESSIVE_SINGLETON),
+        ("Random", RandomStrategy(), "Balanced", _BALANCED_SINGLETON),
+        ("RandomRisky", RandomStrategy(0.8), "Conservative", _CONSERVATIVE_SINGLETON),
     ]
     
     for name1, strat1, name2, strat2 in matchups:
@@ -497,10 +504,10 @@ def demo_optimal_strategy():
     
     # Test de performance
     strategies_comparison = [
-        ("Optimal", OptimalStrategy(), "🎯 Stratégie théoriquement optimale"),
-        ("Balanced", BalancedStrategy(), "⚖️ Stratégie équilibrée existante"),
-        ("Conservative", ConservativeStrategy(), "🛡️ Stratégie conservatrice"),
-        ("Aggressive", AggressiveStrategy(), "⚔️ Stratégie agressive"),
+        ("Optimal", _OPTIMAL_SINGLETON, "🎯 Stratégie théoriquement optimale"),
+        ("Balanced", _BALANCED_SINGLETON, "⚖️ Stratégie équilibrée existante"),
+        ("Conservative", _CONSERVATIVE_SINGLETON, "🛡️ Stratégie conservatrice"),
+        ("Aggressive", _AGGRESSIVE_SINGLETON, "⚔️ Stratégie agressive"),
         ("TargetHigh", TargetedStrategy(min_target_value=29), "🎪 Stratégie ciblée"),
     ]
     
@@ -585,33 +592,29 @@ class AnalyticalStrategy(GameStrategy):
         self.adaptations = []  # Historique des adaptations de stratégie
     
     def choose_dice_value(self, context: GameContext) -> Optional["DiceValue"]:
-        from pikomino import DiceValue, Dice
-        
         turn_state = context.turn_state
-        available_values = [
-            v for v in turn_state.current_roll if turn_state.can_reserve_value(v)
-        ]
+        # Nombre de dés par valeur réservable, en un seul passage sur le lancer
+        counts = turn_state.available_counts()
         
-        if not available_values:
+        if not counts:
             return None
         
         # Analyser les statistiques des adversaires
         self._analyze_opponents(context)
         
         # PRIORITÉ 1: Assurer un ver si nécessaire
-        if DiceValue.WORM in available_values and not turn_state.has_worm():
+        if DiceValue.WORM in counts and not turn_state.has_worm():
             return DiceValue.WORM
         
         # PRIORITÉ 2: Adaptation basée sur la position dans la partie
         if self._should_play_aggressively(context):
-            # Jouer aggressivement : privilégier les hautes valeurs
-            return max(available_values, key=lambda v: Dice.get_point_value(v))
+            # Jouer aggressivement : privilégier les hautes valeurs (table des points)
+            return max(counts, key=POINT_VALUE.__getitem__)
         
         # PRIORITÉ 3: Stratégie équilibrée avec bonus fréquence
         scores = {}
-        for value in available_values:
-            count = turn_state.current_roll.count(value)
-            points = Dice.get_point_value(value)
+        for value, count in counts.items():
+            points = POINT_VALUE[value]
             
             # Formule avec adaptation contextuelle
             base_score = count * points
@@ -802,14 +805,14 @@ def demonstrate_enriched_context():
     
     # Créer des joueurs avec différentes stratégies
     players = [
-        Player("Conservative", ConservativeStrategy()),
-        Player("Aggressive", AggressiveStrategy()),
+        Player("Conservative", _CONSERVATIVE_SINGLETON),
+        Player("Aggressive", _AGGRESSIVE_SINGLETON),
         Player("Analytical", AnalyticalStrategy()),
-        Player("Optimal", OptimalStrategy())
+        Player("Optimal", _OPTIMAL_SINGLETON)
     ]
     
     # Lancer une partie
-    game = PikominoGame(players)
+    game = PikominoGame(players, record_history=True)
     
     print("Début de partie...")
     print(f"Joueurs: {[p.name for p in players]}")
@@ -824,7 +827,7 @@ def demonstrate_enriched_context():
         print(f"--- Tour {tour_num}: {current_player.name} ---")
         
         # Afficher l'état avant le tour
-        print(f"Scores actuels: {[f'{p.name}:{p.get_score()}' for p in players]}")
+        print("Scores actuels: " + " ".join("%s:%d" % (p.name, p.get_score()) for p in players))
         print(f"Tuiles au centre: {len(game.tiles_center)}")
         
         # Jouer le tour
@@ -872,11 +875,11 @@ def compare_strategies_with_history():
     print("\n=== Comparaison de Stratégies avec Historique ===\n")
     
     strategies = [
-        ("Conservative", ConservativeStrategy()),
-        ("Aggressive", AggressiveStrategy()),
-        ("Balanced", BalancedStrategy()),
+        ("Conservative", _CONSERVATIVE_SINGLETON),
+        ("Aggressive", _AGGRESSIVE_SINGLETON),
+        ("Balanced", _BALANCED_SINGLETON),
         ("Analytical", AnalyticalStrategy()),
-        ("Optimal", OptimalStrategy())
+        ("Optimal", _OPTIMAL_SINGLETON)
     ]
     
     results = {}
@@ -889,7 +892,9 @@ def compare_strategies_with_history():
         players = [Player(name, strategy()) for name, strategy in strategies]
         
         # Simuler la partie
-        result = simulate_game([p.name for p in players], [p.strategy for p in players])
+        result = simulate_game(
+            [p.name for p in players], [p.strategy for p in players], record_history=True
+        )
         
         # Enregistrer les résultats
         for player_name, score in result['final_scores'].items():
@@ -5,10 +5,8 @@ Point d'entrée principal pour l'application Pikomino
 
 import sys
 import argparse
-import matplotlib.pyplot as plt
 import statistics
 from collections import defaultdict
-import colorsys
 import pikomino
 from pikomino import (
     Player,
@@ -20,6 +18,8 @@ import strategies
 
 def generate_distinct_colors(n):
     """Génère n couleurs distinctes"""
+    import colorsys
+
     colors = []
     for i in range(n):
         # Utilise le cercle chromatique pour générer des couleurs espacées
@@ -173,6 +173,9 @@ def run_simulation(num_games=100):
         print(f"  Tours moyens: {avg_turns:.1f}")
         print(f"  Taux de réussite des tours: {success_rate:.1f}%")
 
+    # Import différé : matplotlib n'est chargé que pour tracer les graphiques
+    import matplotlib.pyplot as plt
+
     # Configuration générale des graphiques
     plt.rcParams["figure.figsize"] = (15, 10)
     plt.rcParams["axes.grid"] = True
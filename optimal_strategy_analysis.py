@@ -3,7 +3,7 @@
 Analyse pour déterminer la stratégie optimale au Pikomino
 """
 
-from pikomino import simulate_game, DiceValue
+from pikomino import load_kernels, simulate_game, DiceValue
 from strategies import (
     ConservativeStrategy, AggressiveStrategy, BalancedStrategy, 
     TargetedStrategy, RandomStrategy
@@ -198,6 +198,9 @@ def run_strategy_tournament():
     
     print(f"Simulation de {num_games} parties à 4 joueurs chacune...")
     
+    # Noyaux compilés chargés une fois avant la boucle de parties
+    load_kernels()
+    
     for game_num in range(num_games):
         # Partie à 4 joueurs avec stratégies variées
         player_names = list(strategies.keys())[:4]  # 4 premiers
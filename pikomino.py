@@ -1,12 +1,44 @@
-from enum import Enum
-from typing import List, Optional, Dict, Tuple
+from enum import Enum, IntEnum
+from typing import List, Optional, Dict, Tuple, Union
+from collections.abc import MutableMapping, MutableSequence, MutableSet, Sequence
+from functools import cache
+from operator import methodcaller
 import random
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
+from pikomino_rules import (
+    POINT_VALUE as _POINT_VALUE,
+    BYTE_TO_FACE as _BYTE_TO_FACE,
+    REJECTED_BYTES as _REJECTED_BYTES,
+    WORM_FACE as _WORM_FACE,
+    MAX_FACES_PER_TURN as _MAX_FACES_PER_TURN,
+    DEFAULT_STRATEGY as _DEFAULT_STRATEGY,
+    CONSERVATIVE_STRATEGY as _CONSERVATIVE_STRATEGY,
+    AGGRESSIVE_STRATEGY as _AGGRESSIVE_STRATEGY,
+    BALANCED_STRATEGY as _BALANCED_STRATEGY,
+)
 
-class DiceValue(Enum):
-    """Représente les valeurs possibles sur un dé Pikomino"""
+
+@cache
+def load_kernels():
+    """Charge les noyaux compilés (module pikomino_core) et les retourne
+
+    numba et la compilation (ou la relecture du cache disque) ne sont payés qu'au
+    premier noyau utilisé, pas à l'import de pikomino. Les boucles chronométrées
+    l'appellent d'abord pour en sortir ce coût.
+    """
+    import pikomino_core
+
+    return pikomino_core
+
+
+class DiceValue(IntEnum):
+    """Représente les valeurs possibles sur un dé Pikomino
+
+    IntEnum : chaque valeur se comporte comme sa face entière, ce qui permet d'indexer
+    les tables et histogrammes directement et de la mélanger avec des entiers.
+    """
 
     ONE = 1
     TWO = 2
@@ -16,24 +48,131 @@ class DiceValue(Enum):
     WORM = 6  # Le symbole "ver" vaut 5 points mais est distinct
 
 
-@dataclass
+# Face de dé brute (1-6, le ver valant 6) utilisée en interne ; DiceValue reste le type
+# exposé par l'API publique et n'est construit qu'aux frontières
+Face = int
+
+# Correspondance face (entier 1-6) -> DiceValue, indexée directement par la face
+_FACE_TO_VALUE = (None,) + tuple(DiceValue)
+
+# Clé de classement des joueurs (appel en C plutôt qu'une lambda par joueur)
+_player_score = methodcaller("get_score")
+
+# Faces présentes dans chaque masque de faces (bit f : face f), par face croissante :
+# les parcours ne visitent que les bits à 1, sans tester les six faces
+MASK_FACES = tuple(
+    tuple(face for face in range(1, 7) if (mask >> face) & 1) for mask in range(128)
+)
+
+# Nom de chaque valeur, indexé par la face (évite la propriété Enum.name)
+_VALUE_NAMES = (None,) + tuple(value.name for value in DiceValue)
+
+
+
+# Taille de la réserve de faces propre à chaque partie
+_GAME_DICE_SIZE = 4096
+
+
+class PreRolledDice:
+    """Réserve de faces de dés générées en bloc puis consommées une à une
+
+    Les faces non lues sont conservées à chaque recharge : la suite de faces ne dépend
+    que du générateur, pas de la façon dont elle est lue (take, next_face, faces_for).
+    """
+
+    __slots__ = ("size", "rng", "_buffer", "_faces", "_cursor")
+
+    def __init__(self, size: int = 65536, rng=random):
+        self.size = size
+        self.rng = rng
+        self._buffer = b""
+        self._faces = None  # Faces au format des noyaux, converties à la demande
+        self._cursor = 0
+
+    def refill(self):
+        """Génère un nouveau bloc de faces en un seul appel, à la suite des faces non lues"""
+        self._buffer = self._buffer[self._cursor:] + self.rng.randbytes(self.size).translate(
+            _BYTE_TO_FACE, _REJECTED_BYTES
+        )
+        self._faces = None
+        self._cursor = 0
+
+    def next_face(self) -> int:
+        """Retourne la prochaine face (1-6) de la réserve"""
+        if self._cursor >= len(self._buffer):
+            self.refill()
+        face = self._buffer[self._cursor]
+        self._cursor += 1
+        return face
+
+    def take(self, count: int) -> bytes:
+        """Retourne les `count` prochaines faces de la réserve en une seule tranche"""
+        if self._cursor + count > len(self._buffer):
+            self.refill()
+        start = self._cursor
+        self._cursor = start + count
+        return self._buffer[start:self._cursor]
+
+    def faces_for(self, count: int):
+        """Garantit `count` faces disponibles et retourne (faces, curseur) pour les noyaux"""
+        if self._cursor + count > len(self._buffer):
+            self.refill()
+        if self._faces is None:
+            self._faces = load_kernels().as_faces(self._buffer)
+        return self._faces, self._cursor
+
+    def advance_to(self, cursor: int):
+        """Reprend la consommation après les faces lues par un noyau"""
+        self._cursor = cursor
+
+
+# Réserve partagée de Dice.roll / Dice.roll_many et des TurnState créés hors partie :
+# tirée en bloc d'avance, elle n'est pas reprise par random.seed(n). Les parties ont
+# chacune leur réserve (voir PikominoGame)
+_PRE_ROLLED_DICE = PreRolledDice()
+_next_face = _PRE_ROLLED_DICE.next_face
+_take_faces = _PRE_ROLLED_DICE.take
+
+
+def roll_die() -> DiceValue:
+    """Lance un dé et retourne sa valeur"""
+    return _FACE_TO_VALUE[_next_face()]
+
+
+def roll_dice(count: int) -> List[DiceValue]:
+    """Lance `count` dés d'un coup, en une seule tranche de la réserve pré-générée"""
+    return [_FACE_TO_VALUE[face] for face in _take_faces(count)]
+
+
+def face_value(face: Face) -> DiceValue:
+    """Retourne la DiceValue d'une face brute (1-6)"""
+    return _FACE_TO_VALUE[face]
+
+
+def dicevalue_name(face: Face) -> str:
+    """Retourne le nom (ONE ... WORM) d'une face brute, pour les détails de tour"""
+    return _VALUE_NAMES[face]
+
+
+def point_value(value: DiceValue) -> int:
+    """Retourne la valeur en points d'une face de dé"""
+    return _POINT_VALUE[value]
+
+
 class Dice:
-    """Représente un dé du jeu Pikomino"""
+    """Représente un dé du jeu Pikomino (espace de noms conservé pour compatibilité)"""
 
-    @staticmethod
-    def roll() -> DiceValue:
-        """Lance un dé et retourne sa valeur"""
-        return random.choice(list(DiceValue))
+    roll = staticmethod(roll_die)
+    roll_many = staticmethod(roll_dice)
+    get_point_value = staticmethod(point_value)
 
-    @staticmethod
-    def get_point_value(value: DiceValue) -> int:
-        """Retourne la valeur en points d'une face de dé"""
-        if value == DiceValue.WORM:
-            return 5
-        return value.value
 
 
-@dataclass
+# Nombre de vers des tuiles 21-36, indexé par la valeur (0 pour les autres valeurs)
+_WORMS_BY_VALUE = (0,) * 21 + (1,) * 4 + (2,) * 4 + (3,) * 4 + (4,) * 4
+
+
+@dataclass(slots=True)
 class Tile:
     """Représente une tuile Pikomino"""
 
@@ -42,28 +181,152 @@ class Tile:
 
     def __post_init__(self):
         """Initialise les tuiles selon les règles du jeu"""
-        # Les vraies valeurs des tuiles Pikomino (21-36)
-        # avec le nombre de vers correspondant
-        worm_mapping = {
-            21: 1,
-            22: 1,
-            23: 1,
-            24: 1,
-            25: 2,
-            26: 2,
-            27: 2,
-            28: 2,
-            29: 3,
-            30: 3,
-            31: 3,
-            32: 3,
-            33: 4,
-            34: 4,
-            35: 4,
-            36: 4,
-        }
-        if self.value in worm_mapping:
-            self.worms = worm_mapping[self.value]
+        # Les vraies valeurs des tuiles Pikomino (21-36) imposent leur nombre de vers
+        if 21 <= self.value <= 36:
+            self.worms = _WORMS_BY_VALUE[self.value]
+
+
+# Tuile canonique de chaque valeur 21-36 : les tuiles ne sont jamais modifiées, une
+# seule instance par valeur sert à toutes les parties et aux instantanés
+TILE_BY_VALUE: Dict[int, Tile] = {value: Tile(value, 0) for value in range(21, 37)}
+
+
+def tiles_from_values(values: bytes) -> List[Tile]:
+    """Tuiles correspondant à une suite de valeurs (tuiles canoniques pour 21-36)"""
+    return [TILE_BY_VALUE.get(value) or Tile(value, 0) for value in values]
+
+
+# Plage des valeurs de tuiles : la tuile de valeur v occupe le bit (v - 21) du masque
+_MIN_TILE_VALUE = 21
+_MAX_TILE_VALUE = 36
+
+
+class _CenterTiles(MutableSequence):
+    """Tuiles du centre, rangées par valeur croissante et résumées par un masque de bits
+
+    Chaque valeur de tuile est unique : la tuile de valeur v est rangée à l'indice
+    v - 21 et signalée par le bit v - 21 du masque. Les recherches par score se
+    réduisent ainsi à des opérations sur le masque.
+    """
+
+    __slots__ = ("_by_value", "mask")
+
+    def __init__(self, tiles=()):
+        self._by_value: List[Optional[Tile]] = [None] * (_MAX_TILE_VALUE - _MIN_TILE_VALUE + 1)
+        self.mask = 0
+        for tile in tiles:
+            self.append(tile)
+
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+
+    def __iter__(self):
+        by_value = self._by_value
+        mask = self.mask
+        while mask:
+            low_bit = mask & -mask
+            yield by_value[low_bit.bit_length() - 1]
+            mask ^= low_bit
+
+    def __contains__(self, tile) -> bool:
+        offset = tile.value - _MIN_TILE_VALUE
+        return 0 <= offset < len(self._by_value) and self._by_value[offset] == tile
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        return self._by_value[self._offset_at(index)]
+
+    def _offset_at(self, index: int) -> int:
+        """Indice dans _by_value de la tuile en position `index`, sans matérialiser la liste"""
+        count = self.mask.bit_count()
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("center index out of range")
+        mask = self.mask
+        for _ in range(index):
+            mask &= mask - 1  # Retire le bit de poids faible
+        return (mask & -mask).bit_length() - 1
+
+    def __setitem__(self, index, tile: Tile):
+        del self[index]
+        self.append(tile)
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            for tile in list(self)[index]:
+                self.remove(tile)
+        else:
+            self.discard_value(self._offset_at(index) + _MIN_TILE_VALUE)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def insert(self, index: int, tile: Tile):
+        """Ajoute une tuile ; sa position est imposée par sa valeur"""
+        self.append(tile)
+
+    def append(self, tile: Tile):
+        offset = tile.value - _MIN_TILE_VALUE
+        if not 0 <= offset < len(self._by_value):
+            raise ValueError(f"Valeur de tuile hors plage: {tile.value}")
+        self._by_value[offset] = tile
+        self.mask |= 1 << offset
+
+    def remove(self, tile: Tile):
+        if tile not in self:
+            raise ValueError(f"Tuile absente du centre: {tile}")
+        self.discard_value(tile.value)
+
+    def discard_value(self, value: int):
+        """Retire la tuile de cette valeur si elle est au centre"""
+        offset = value - _MIN_TILE_VALUE
+        self._by_value[offset] = None
+        self.mask &= ~(1 << offset)
+
+    def pop(self, index: int = -1) -> Tile:
+        if index != -1:
+            tile = self._by_value[self._offset_at(index)]
+        elif self.mask:
+            tile = self._by_value[self.mask.bit_length() - 1]
+        else:
+            raise IndexError("pop from empty center")
+        self.discard_value(tile.value)
+        return tile
+
+    def get(self, value: int) -> Optional[Tile]:
+        """Retourne la tuile de cette valeur si elle est au centre"""
+        offset = value - _MIN_TILE_VALUE
+        if 0 <= offset < len(self._by_value):
+            return self._by_value[offset]
+        return None
+
+    def _mask_up_to(self, score: int) -> int:
+        """Bits des tuiles de valeur inférieure ou égale au score"""
+        width = score - _MIN_TILE_VALUE + 1
+        return self.mask & ((1 << width) - 1) if width > 0 else 0
+
+    def up_to(self, score: int) -> List[Tile]:
+        """Tuiles de valeur inférieure ou égale au score, par valeur croissante"""
+        by_value = self._by_value
+        mask = self._mask_up_to(score)
+        tiles = []
+        while mask:
+            low_bit = mask & -mask
+            tiles.append(by_value[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return tiles
+
+    def highest_up_to(self, score: int) -> Optional[Tile]:
+        """Plus haute tuile de valeur inférieure ou égale au score"""
+        mask = self._mask_up_to(score)
+        return self._by_value[mask.bit_length() - 1] if mask else None
 
 
 class TurnResult(Enum):
@@ -75,80 +338,356 @@ class TurnResult(Enum):
     FAILED_NO_VALID_CHOICE = "failed_no_valid_choice"
 
 
-@dataclass
-class TurnState:
-    """État d'un tour en cours"""
+class _ReservedDice(MutableMapping):
+    """Dés réservés par valeur, avec score et présence d'un ver tenus à jour
+
+    Les comptes sont rangés dans un tableau de 7 octets indexé par la face, et les
+    valeurs présentes dans un masque de bits.
+    """
+
+    __slots__ = ("_counts", "_mask", "score")
+
+    def __init__(self, reserved: Optional[Dict[DiceValue, int]] = None):
+        self._counts = bytearray(7)
+        self._mask = 0
+        self.score = 0
+        if reserved:
+            self.update(reserved)
+
+    @property
+    def has_worm(self) -> bool:
+        return bool(self._mask >> _WORM_FACE & 1)
+
+    def add(self, value: DiceValue, count: int):
+        """Ajoute des dés d'une valeur aux dés réservés"""
+        self._counts[value] += count
+        self._mask |= 1 << value
+        self.score += _POINT_VALUE[value] * count
+
+    def __getitem__(self, value: DiceValue) -> int:
+        if not (isinstance(value, int) and 0 < value < 7 and self._mask >> value & 1):
+            raise KeyError(value)
+        return self._counts[value]
+
+    def __setitem__(self, value: DiceValue, count: int):
+        self.score += _POINT_VALUE[value] * (count - self._counts[value])
+        self._counts[value] = count
+        self._mask |= 1 << value
+
+    def __delitem__(self, value: DiceValue):
+        count = self[value]
+        self.score -= _POINT_VALUE[value] * count
+        self._counts[value] = 0
+        self._mask &= ~(1 << value)
+
+    def __contains__(self, value) -> bool:
+        return isinstance(value, int) and 0 < value < 7 and bool(self._mask >> value & 1)
+
+    def __iter__(self):
+        mask = self._mask
+        return (_FACE_TO_VALUE[face] for face in range(1, 7) if mask >> face & 1)
+
+    def __len__(self) -> int:
+        return self._mask.bit_count()
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+# Histogramme vide, recopié dans le tampon de comptage à chaque lancer
+_EMPTY_COUNTS = bytes(7)
+
+
+class _UsedValues(MutableSet):
+    """Vue ensembliste sur le masque de bits des valeurs déjà réservées d'un tour"""
+
+    __slots__ = ("_turn_state",)
 
-    remaining_dice: int = 8
-    reserved_dice: Dict[DiceValue, int] = field(default_factory=dict)
-    used_values: set = field(default_factory=set)
-    current_roll: List[DiceValue] = field(default_factory=list)
+    def __init__(self, turn_state: "TurnState"):
+        self._turn_state = turn_state
+
+    def __contains__(self, value) -> bool:
+        return (self._turn_state._used_mask >> value) & 1 == 1
+
+    def __iter__(self):
+        mask = self._turn_state._used_mask
+        return (value for value in _FACE_TO_VALUE[1:] if (mask >> value) & 1)
+
+    def __len__(self) -> int:
+        return self._turn_state._used_mask.bit_count()
+
+    def add(self, value: DiceValue):
+        self._turn_state._used_mask |= 1 << value
+
+    def discard(self, value: DiceValue):
+        self._turn_state._used_mask &= ~(1 << value)
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+
+class TurnState:
+    """État d'un tour en cours
+
+    Le lancer courant est stocké sous forme de bytearray de faces (1 octet par dé)
+    et n'est converti en DiceValue qu'à la frontière de l'API (current_roll).
+    Un histogramme de 7 cases indexé par la face donne le nombre de dés par valeur.
+    Le score et la présence d'un ver sont tenus à jour à chaque réservation.
+    Les valeurs déjà utilisées forment un masque de bits (bit n pour la face n).
+    """
+
+    __slots__ = (
+        "remaining_dice", "_take_faces", "_reserved", "_used_mask", "_roll", "_counts",
+        "_roll_mask",
+    )
+
+    def __init__(
+        self,
+        remaining_dice: int = 8,
+        reserved_dice: Optional[Dict[DiceValue, int]] = None,
+        used_values: Optional[set] = None,
+        current_roll: Optional[List[DiceValue]] = None,
+        dice: Optional[PreRolledDice] = None,
+    ):
+        self.remaining_dice = remaining_dice
+        # Réserve de faces du tour : celle de la partie, ou la réserve partagée du module
+        self._take_faces = dice.take if dice is not None else _take_faces
+        self.reserved_dice = reserved_dice
+        self._used_mask = 0
+        if used_values:
+            self.used_values = used_values
+        self._roll = bytearray()
+        self._counts = bytearray(7)
+        self._roll_mask = 0  # Bit f : la face f est présente dans le lancer courant
+        if current_roll:
+            self.current_roll = current_roll
+
+    @property
+    def reserved_dice(self) -> MutableMapping:
+        """Dés réservés par valeur"""
+        return self._reserved
+
+    @reserved_dice.setter
+    def reserved_dice(self, reserved: Optional[Dict[DiceValue, int]]):
+        self._reserved = _ReservedDice(reserved)
+
+    @property
+    def used_values(self) -> MutableSet:
+        """Valeurs déjà réservées pendant ce tour"""
+        return _UsedValues(self)
+
+    @used_values.setter
+    def used_values(self, values):
+        mask = 0
+        for value in values:
+            mask |= 1 << value
+        self._used_mask = mask
+
+    @property
+    def current_roll(self) -> List[DiceValue]:
+        """Lancer courant sous forme de liste de DiceValue"""
+        return [_FACE_TO_VALUE[face] for face in self._roll]
+
+    def roll_faces(self) -> bytes:
+        """Copie compacte du lancer courant : une face brute (1-6) par octet"""
+        return bytes(self._roll)
+
+    @current_roll.setter
+    def current_roll(self, roll: List[DiceValue]):
+        # Les tampons du lancer et de l'histogramme sont réutilisés d'un lancer à l'autre
+        self._roll[:] = roll
+        counts = self._counts
+        counts[:] = _EMPTY_COUNTS
+        mask = 0
+        for face in self._roll:
+            counts[face] += 1
+            mask |= 1 << face
+        self._roll_mask = mask
+
+    def roll_dice(self):
+        """Lance les dés restants et met à jour le lancer et son histogramme
+
+        Tant que Dice.roll n'est pas remplacé, tout le lancer est tiré d'un bloc dans
+        la réserve pré-générée ; sinon chaque dé passe par Dice.roll.
+        """
+        counts = self._counts
+        counts[:] = _EMPTY_COUNTS
+        roll = Dice.roll
+        if roll is roll_die:
+            faces = self._take_faces(self.remaining_dice)
+        else:
+            faces = [roll() for _ in range(self.remaining_dice)]
+        mask = 0
+        for face in faces:
+            counts[face] += 1
+            mask |= 1 << face
+        self._roll[:] = faces
+        self._roll_mask = mask
+
+    @property
+    def roll_histogram(self) -> memoryview:
+        """Histogramme du lancer courant indexé par face (0 inutilisé), tenu à jour à chaque lancer"""
+        return memoryview(self._counts).toreadonly()
+
+    def count(self, value: DiceValue) -> int:
+        """Nombre de dés du lancer courant montrant cette valeur"""
+        return self._counts[value]
+
+    def reservable_faces(self) -> List[Face]:
+        """Faces distinctes du lancer courant encore réservables, dans l'ordre du lancer
+
+        Un max() sur cet ordre départage les égalités par la première face lancée.
+        """
+        seen = self._used_mask
+        faces = []
+        for face in self._roll:
+            if not seen >> face & 1:
+                seen |= 1 << face
+                faces.append(face)
+        return faces
+
+    def available_values(self) -> List[DiceValue]:
+        """Valeurs distinctes du lancer courant encore réservables, dans l'ordre du lancer"""
+        return [_FACE_TO_VALUE[face] for face in self.reservable_faces()]
+
+    def available_counts(self) -> Dict[DiceValue, int]:
+        """Nombre de dés par valeur encore réservable du lancer courant, dans l'ordre du lancer"""
+        counts = self._counts
+        return {_FACE_TO_VALUE[face]: counts[face] for face in self.reservable_faces()}
+
+    @property
+    def used_mask(self) -> int:
+        """Valeurs déjà réservées sous forme de masque (bit f : face f)"""
+        return self._used_mask
+
+    @property
+    def current_roll_mask(self) -> int:
+        """Faces présentes dans le lancer courant sous forme de masque (bit f : face f)"""
+        return self._roll_mask
+
+    def reservable_mask(self) -> int:
+        """Faces du lancer encore réservables sous forme de masque (bit f : face f)"""
+        return self._roll_mask & ~self._used_mask
+
+    def most_frequent_value(self) -> Optional[DiceValue]:
+        """Valeur réservable la plus fréquente du lancer (la première lancée en cas d'égalité)"""
+        counts = self._counts
+        best, best_count = 0, 0
+        for face in self.reservable_faces():
+            count = counts[face]
+            if count > best_count:
+                best, best_count = face, count
+        return _FACE_TO_VALUE[best] if best else None
 
     def get_total_score(self) -> int:
         """Calcule le score total des dés réservés"""
-        return sum(
-            Dice.get_point_value(value) * count
-            for value, count in self.reserved_dice.items()
-        )
+        return self._reserved.score
 
     def has_worm(self) -> bool:
         """Vérifie si au moins un ver a été réservé"""
-        return DiceValue.WORM in self.reserved_dice
+        return self._reserved.has_worm
+
+    @property
+    def ready_to_take(self) -> bool:
+        """Vrai si les dés réservés permettent de prendre une tuile (21 points et un ver)"""
+        reserved = self._reserved
+        return reserved.score >= 21 and reserved._mask >> _WORM_FACE & 1 == 1
+
+    def reserve(self, value: DiceValue) -> int:
+        """Réserve tous les dés du lancer courant montrant cette valeur et retourne leur nombre"""
+        count = self._counts[value]
+        self._apply_reservation(value, count)
+        return count
+
+    def _apply_reservation(self, value: DiceValue, count: int):
+        """Enregistre la réservation de `count` dés de cette valeur"""
+        self._reserved.add(value, count)
+        self._used_mask |= 1 << value
+        self.remaining_dice -= count
 
     def can_reserve_value(self, value: DiceValue) -> bool:
         """Vérifie si une valeur peut être réservée"""
-        return value in self.current_roll and value not in self.used_values
+        return (self._roll_mask & ~self._used_mask) >> value & 1 == 1
 
 
 # Import des stratégies depuis le module dédié
-from strategies import GameStrategy, GameHistory, GameContext, GameStateSnapshot, TurnHistory
+from strategies import (
+    GameStrategy,
+    GameHistory,
+    GameContext,
+    GameStateSnapshot,
+    TurnHistory,
+    TurnContext,
+    ConservativeStrategy,
+    AggressiveStrategy,
+    BalancedStrategy,
+    OptimalStrategy,
+)
 
 
 class Player:
     """Représente un joueur"""
 
+    __slots__ = ("name", "strategy", "_tiles", "_score", "_top", "top_value")
+
     def __init__(self, name: str, strategy: Optional[GameStrategy] = None):
         self.name = name
-        self.tiles: List[Tile] = []
+        self.tiles = ()
         self.strategy = strategy
 
+    @property
+    def tiles(self) -> Tuple[Tile, ...]:
+        """Pile de tuiles du joueur (la dernière est celle du dessus)
+
+        La pile est exposée en lecture seule : elle ne change que par add_tile,
+        remove_top_tile ou une affectation, qui tiennent le score et le sommet à jour.
+        """
+        return self._tiles
+
+    @tiles.setter
+    def tiles(self, tiles: Sequence[Tile]):
+        self._tiles = tiles = tuple(tiles)
+        self._score = sum(tile.worms for tile in tiles)
+        self._top = tiles[-1] if tiles else None
+        self.top_value = self._top.value if tiles else 0
+
     def get_score(self) -> int:
         """Calcule le score total du joueur (nombre de vers)"""
-        return sum(tile.worms for tile in self.tiles)
+        return self._score
 
     def get_top_tile(self) -> Optional[Tile]:
         """Retourne la tuile du dessus de la pile du joueur"""
-        return self.tiles[-1] if self.tiles else None
+        return self._top
 
     def add_tile(self, tile: Tile):
         """Ajoute une tuile à la pile du joueur"""
-        self.tiles.append(tile)
+        self._tiles += (tile,)
+        self._score += tile.worms
+        self._top = tile
+        self.top_value = tile.value
 
     def remove_top_tile(self) -> Optional[Tile]:
         """Retire et retourne la tuile du dessus"""
-        return self.tiles.pop() if self.tiles else None
+        if not self._tiles:
+            return None
+        tile = self._top
+        self._tiles = tiles = self._tiles[:-1]
+        self._score -= tile.worms
+        if tiles:
+            self._top = tiles[-1]
+            self.top_value = self._top.value
+        else:
+            self._top = None
+            self.top_value = 0
+        return tile
 
     def choose_dice_value(self, context: GameContext) -> Optional[DiceValue]:
         """Choisit une valeur de dé à réserver"""
         if self.strategy:
             return self.strategy.choose_dice_value(context)
 
-        # Stratégie par défaut : choisir la valeur la plus fréquente
-        turn_state = context.turn_state
-        available_values = [
-            v for v in turn_state.current_roll if turn_state.can_reserve_value(v)
-        ]
-
-        if not available_values:
-            return None
-
-        # Compter les occurrences de chaque valeur
-        value_counts = {}
-        for value in available_values:
-            value_counts[value] = turn_state.current_roll.count(value)
-
-        # Choisir la valeur avec le plus d'occurrences
-        return max(value_counts.keys(), key=lambda v: value_counts[v])
+        # Stratégie par défaut : choisir la valeur avec le plus d'occurrences
+        return context.turn_state.most_frequent_value()
 
     def should_continue_turn(self, context: GameContext) -> bool:
         """Décide si continuer le tour ou s'arrêter"""
@@ -159,11 +698,54 @@ class Player:
         return context.turn_state.get_total_score() < 25
 
 
-class PikominoGame:
-    """Classe principale pour gérer une partie de Pikomino"""
+# Stratégies dont la phase de dés est jouée par le noyau compilé : (identifiant, seuil
+# d'arrêt), indexées par le type exact de la stratégie (NoneType : joueur sans stratégie)
+_TURN_KERNELS = {
+    type(None): (_DEFAULT_STRATEGY, 25),
+    ConservativeStrategy: (_CONSERVATIVE_STRATEGY, 21),
+    AggressiveStrategy: (_AGGRESSIVE_STRATEGY, 30),
+    BalancedStrategy: (_BALANCED_STRATEGY, 28),  # Seuils fixés dans le noyau
+}
+
+# Stratégies dont les paramètres du noyau dépendent de la partie : ils sont demandés à
+# la stratégie (compiled_turn) en début de tour
+_CONTEXT_TURN_KERNELS = (OptimalStrategy,)
+
 
-    def __init__(self, players: List[Player]):
+class PikominoGame:
+    """Classe principale pour gérer une partie de Pikomino
+
+    Les tuiles du centre (tiles_center) sont indexées par valeur et résumées par
+    un masque de bits : les recherches par score se font sans parcours de liste.
+    """
+
+    __slots__ = (
+        "players", "rng", "_dice", "record_history", "current_player_idx",
+        "_tiles_center", "removed_tiles", "game_over", "turn_history", "game_history",
+        "turn_number", "_decision_context", "_game_context", "_turn_context",
+        "_kernel_choices", "_snapshot_parts", "_state_cache",
+    )
+
+    def __init__(
+        self,
+        players: List[Player],
+        record_history: bool = False,
+        rng: Optional[random.Random] = None,
+    ):
         self.players = players
+        # Un générateur propre à la partie (graine explicite) lui donne sa propre réserve
+        # de faces : parties reproductibles et indépendantes de l'état global de random.
+        # Sans lui, la réserve de la partie est amorcée par le générateur global, pour
+        # que random.seed(n) suffise à rejouer la même partie
+        self.rng = rng
+        self._dice = PreRolledDice(
+            _GAME_DICE_SIZE,
+            rng if rng is not None else random.Random(random.getrandbits(64)),
+        )
+        # Les historiques (turn_history, historique structuré avec instantanés) et le
+        # détail des lancers dans turn_details ne sont construits que sur demande :
+        # les simulations en masse n'en ont pas besoin
+        self.record_history = record_history
         self.current_player_idx = 0
         self.tiles_center = self._initialize_tiles()
         self.removed_tiles: List[Tile] = []
@@ -171,14 +753,32 @@ class PikominoGame:
         self.turn_history: List[Dict] = []  # Ancienne structure (pour compatibilité)
         self.game_history = GameHistory()  # Nouvel historique structuré
         self.turn_number = 0
+        self._decision_context: Optional[Union[GameContext, TurnContext]] = None
+        # Contextes réutilisés d'un tour à l'autre (remis à jour en place)
+        self._game_context: Optional[GameContext] = None
+        self._turn_context: Optional[TurnContext] = None
+        self._kernel_choices = None  # Tampon de sortie de play_turn_core, créé au besoin
+        self._snapshot_parts = None  # Dernières listes copiées pour les instantanés
+        # Dernier résultat de get_game_state, avec la clé de l'état dont il est tiré
+        self._state_cache: Optional[Tuple[Tuple, Dict]] = None
+
+    @property
+    def tiles_center(self) -> MutableSequence:
+        """Tuiles disponibles au centre, par valeur croissante"""
+        return self._tiles_center
+
+    @tiles_center.setter
+    def tiles_center(self, tiles: List[Tile]):
+        self._tiles_center = _CenterTiles(tiles)
+
+    @property
+    def center_mask(self) -> int:
+        """Tuiles du centre sous forme de masque (bit i : tuile de valeur 21 + i)"""
+        return self._tiles_center.mask
 
     def _initialize_tiles(self) -> List[Tile]:
-        """Initialise les tuiles du centre"""
-        tiles = []
-        for value in range(21, 37):  # Tuiles 21 à 36
-            tile = Tile(value, 0)  # Le post_init calculera les vers
-            tiles.append(tile)
-        return tiles
+        """Initialise les tuiles du centre (tuiles canoniques 21 à 36)"""
+        return list(TILE_BY_VALUE.values())
 
     def get_current_player(self) -> Player:
         """Retourne le joueur actuel"""
@@ -192,110 +792,169 @@ class PikominoGame:
         """Retourne les tuiles disponibles dans le centre"""
         return [tile for tile in self.tiles_center if tile is not None]
 
-    def can_take_tile(self, tile_value: int, score: int, has_worm: bool) -> bool:
+    @staticmethod
+    def can_take_tile(tile_value: int, score: int, has_worm: bool) -> bool:
         """Vérifie si on peut prendre une tuile donnée"""
         return has_worm and score >= tile_value
 
     def _create_game_state_snapshot(self, turn_details: Dict = None) -> GameStateSnapshot:
-        """Crée un instantané de l'état du jeu"""
+        """Crée un instantané de l'état du jeu
+
+        Les tuiles y sont stockées par valeur (un octet par tuile) ; les valeurs d'une
+        pile inchangée depuis l'instantané précédent sont partagées entre instantanés.
+        """
+        removed_tiles = self.removed_tiles
+        center_key = self.center_mask
+        removed_key = (len(removed_tiles), removed_tiles[-1] if removed_tiles else None)
+        if self._snapshot_parts is None:
+            self._snapshot_parts = (None, None, None, None, {})
+        cached_center_key, center, cached_removed_key, removed, stacks = self._snapshot_parts
+
+        if center_key != cached_center_key:
+            center = bytes(tile.value for tile in self._tiles_center)
+        if removed_key != cached_removed_key:
+            removed = bytes(tile.value for tile in removed_tiles)
+        # Une pile n'est relue que si elle a changé (une pile ne change que par son
+        # sommet : taille et sommet suffisent)
+        players_values = {}
+        for player in self.players:
+            tiles = player.tiles
+            key = (len(tiles), tiles[-1] if tiles else None)
+            cached = stacks.get(player.name)
+            if cached is None or cached[0] != key:
+                cached = stacks[player.name] = (key, bytes(tile.value for tile in tiles))
+            players_values[player.name] = cached[1]
+        self._snapshot_parts = (center_key, center, removed_key, removed, stacks)
+
         return GameStateSnapshot(
             turn_number=self.turn_number,
             current_player_name=self.get_current_player().name,
-            tiles_center=list(self.tiles_center),  # Copie des tuiles du centre
-            players_tiles={p.name: list(p.tiles) for p in self.players},  # Copie des tuiles des joueurs
-            removed_tiles=list(self.removed_tiles),  # Copie des tuiles retirées
+            center_values=center,
+            players_values=players_values,
+            removed_values=removed,
             player_scores={p.name: p.get_score() for p in self.players},
             turn_details=turn_details or {}
         )
 
-    def _build_game_context(self, turn_state: TurnState) -> GameContext:
+    def _build_game_context(
+        self, turn_state: TurnState, current_player: Optional[Player] = None
+    ) -> GameContext:
         """Construit le contexte complet du jeu pour les stratégies"""
-        current_player = self.get_current_player()
-        score = turn_state.get_total_score()
-        
-        # Calculer les tuiles volables (score exact)
-        stealable_tiles = []
-        for player in self.players:
-            if player != current_player:
-                top_tile = player.get_top_tile()
-                if top_tile and top_tile.value == score:
-                    stealable_tiles.append((top_tile, player))
-
-        # Calculer les tuiles du centre accessibles (score >= valeur tuile)
-        available_center_tiles = [t for t in self.tiles_center if t.value <= score]
-
-        return GameContext(
-            turn_state=turn_state,
-            current_player=current_player,
-            all_players=list(self.players),
-            tiles_center=list(self.tiles_center),
-            removed_tiles=list(self.removed_tiles),
-            stealable_tiles=stealable_tiles,
-            available_center_tiles=available_center_tiles,
-            game_history=self.game_history,
-            turn_number=self.turn_number
-        )
+        if current_player is None:
+            current_player = self.get_current_player()
+        strategy = current_player.strategy
+        # Les stratégies de confiance lisent l'état du jeu sans copie
+        if strategy is not None and strategy.trusted:
+            players, tiles_center, removed_tiles = (
+                self.players, self._tiles_center, self.removed_tiles
+            )
+        else:
+            players, tiles_center, removed_tiles = (
+                list(self.players), list(self._tiles_center), list(self.removed_tiles)
+            )
 
-    def find_tile_to_take(self, score: int, has_worm: bool, turn_state: TurnState) -> Optional[Tile]:
-        """Trouve la meilleure tuile à prendre avec le score donné"""
+        # Les tuiles volables et accessibles sont calculées par le contexte à la demande
+        context = self._game_context
+        if context is None:
+            context = self._game_context = GameContext(
+                turn_state=turn_state,
+                current_player=current_player,
+                all_players=players,
+                tiles_center=tiles_center,
+                removed_tiles=removed_tiles,
+                game_history=self.game_history,
+                turn_number=self.turn_number
+            )
+        else:
+            context.reset(
+                turn_state, current_player, players, tiles_center, removed_tiles,
+                game_history=self.game_history, turn_number=self.turn_number,
+            )
+        return context
+
+    def _build_decision_context(
+        self, turn_state: TurnState
+    ) -> Union[GameContext, TurnContext]:
+        """Contexte passé aux décisions de dés, construit une seule fois par tour
+
+        Le contexte complet n'est construit que si la stratégie en a besoin ; entre deux
+        décisions du même tour, seul l'état du tour change et le contexte est réutilisé.
+        """
+        context = self._decision_context
+        if context is None or context.turn_state is not turn_state:
+            current_player = self.get_current_player()
+            strategy = current_player.strategy
+            if strategy is None or not strategy.needs_full_context:
+                context = self._turn_context
+                if context is None:
+                    context = self._turn_context = TurnContext(
+                        turn_state, current_player, self.turn_number
+                    )
+                else:
+                    context.turn_state = turn_state
+                    context.current_player = current_player
+                    context.turn_number = self.turn_number
+            else:
+                context = self._build_game_context(turn_state, current_player)
+            self._decision_context = context
+        return context
+
+    def find_tile_to_take(
+        self,
+        score: int,
+        has_worm: bool,
+        turn_state: TurnState,
+        current_player: Optional[Player] = None,
+    ) -> Optional[Tile]:
+        """Trouve la meilleure tuile à prendre avec le score donné
+
+        `current_player` évite de relire le joueur actuel quand l'appelant l'a déjà.
+        """
         if not has_worm:
             return None
 
-        current_player = self.get_current_player()
+        if current_player is None:
+            current_player = self.get_current_player()
         
         # Si le joueur a une stratégie, utiliser le nouveau système
         if current_player.strategy:
-            context = self._build_game_context(turn_state)
+            context = self._build_game_context(turn_state, current_player)
             return current_player.strategy.choose_target_tile(context)
 
-        # Comportement par défaut (code original)
-        # Rassembler toutes les tuiles volables (score exact)
-        stealable_tiles = []
-        for player in self.players:
-            if player != current_player:
-                top_tile = player.get_top_tile()
-                if top_tile and top_tile.value == score:
-                    stealable_tiles.append((top_tile, player))
+        # Comportement par défaut : priorité au vol (score exact) ; aucun vol possible
+        # hors 21-36. Toutes les tuiles volables valent alors `score` et portent le même
+        # nombre de vers : la première trouvée est la meilleure
+        if _MIN_TILE_VALUE <= score <= _MAX_TILE_VALUE:
+            for player in self.players:
+                if player.top_value == score and player is not current_player:
+                    return player._top
 
-        # Rassembler les tuiles du centre accessibles (score >= valeur tuile)
-        center_tiles = [t for t in self.tiles_center if t.value <= score]
+        # Prendre la tuile de plus haute valeur possible (score >= valeur tuile)
+        return self._tiles_center.highest_up_to(score)
 
-        # Comportement par défaut : priorité au vol, sinon plus haute tuile du centre
-        if stealable_tiles:
-            # Choisir la tuile volable avec le plus de vers
-            return max(stealable_tiles, key=lambda x: x[0].worms)[0]
-
-        if center_tiles:
-            # Prendre la tuile de plus haute valeur possible
-            return max(center_tiles, key=lambda t: t.value)
-
-        return None
-
-    def take_tile(self, tile: Tile) -> bool:
+    def take_tile(self, tile: Tile, current_player: Optional[Player] = None) -> bool:
         """Prend une tuile et l'attribue au joueur actuel"""
-        current_player = self.get_current_player()
+        if current_player is None:
+            current_player = self.get_current_player()
 
         # D'abord vérifier si la tuile est chez un autre joueur (comparaison par référence)
         for player in self.players:
-            if player != current_player:
-                top_tile = player.get_top_tile()
-                if top_tile is tile:
-                    removed_tile = player.remove_top_tile()
-                    current_player.add_tile(removed_tile)
-                    return True
+            if player._top is tile and player is not current_player:
+                current_player.add_tile(player.remove_top_tile())
+                return True
 
         # Sinon vérifier si la tuile est dans le centre (comparaison par référence aussi)
-        for i, center_tile in enumerate(self.tiles_center):
-            if center_tile is tile:
-                self.tiles_center.remove(center_tile)
-                current_player.add_tile(center_tile)
-                return True
+        if self._tiles_center.get(tile.value) is tile:
+            self._tiles_center.discard_value(tile.value)
+            current_player.add_tile(tile)
+            return True
 
         return False
 
-    def handle_failed_turn(self):
+    def handle_failed_turn(self, current_player: Optional[Player] = None):
         """Gère un tour raté"""
-        current_player = self.get_current_player()
+        if current_player is None:
+            current_player = self.get_current_player()
 
         # Le joueur perd sa tuile du dessus
         lost_tile = current_player.remove_top_tile()
@@ -303,19 +962,74 @@ class PikominoGame:
             self.removed_tiles.append(lost_tile)
 
         # Retirer la tuile la plus haute du centre
-        if self.tiles_center:
-            highest_tile = max(self.tiles_center, key=lambda t: t.value)
-            self.tiles_center.remove(highest_tile)
-            self.removed_tiles.append(highest_tile)
+        if self.center_mask:
+            self.removed_tiles.append(self._tiles_center.pop())
+
+    def _record_turn(
+        self,
+        player: Player,
+        turn_state: TurnState,
+        dice_rolls: List[bytes],
+        game_state_before: Optional[GameStateSnapshot],
+        turn_details: Dict,
+        result: TurnResult,
+        tile_taken: Optional[Tile],
+    ):
+        """Enregistre un tour terminé dans les historiques"""
+        if not self.record_history:
+            return
+
+        self.turn_history.append(turn_details)
+
+        self.game_history.add_turn(
+            TurnHistory(
+                turn_number=self.turn_number,
+                player_name=player.name,
+                dice_rolls=dice_rolls,
+                reserved_dice=turn_state.reserved_dice,
+                final_score=turn_state.get_total_score(),
+                final_has_worm=turn_state.has_worm(),
+                tile_taken=tile_taken,
+                result=result,
+                game_state_before=game_state_before,
+                game_state_after=self._create_game_state_snapshot(turn_details),
+            )
+        )
+
+    def _play_compiled_dice_phase(self, turn_state: TurnState, kernel: Tuple[int, int]) -> bool:
+        """Joue la phase de dés avec play_turn_core et reporte ses réservations
+
+        Retourne False si le tour est raté faute de valeur réservable.
+        """
+        strategy_id, threshold = kernel
+        kernels = load_kernels()
+        dice = self._dice
+        faces, cursor = dice.faces_for(_MAX_FACES_PER_TURN)
+        choices = self._kernel_choices
+        if choices is None:
+            choices = self._kernel_choices = kernels.new_choices()
+        reservations, failed, cursor = kernels.play_turn_core(
+            faces, cursor, strategy_id, threshold, choices
+        )
+        dice.advance_to(cursor)
+
+        for index in range(reservations):
+            turn_state._apply_reservation(
+                _FACE_TO_VALUE[int(choices[2 * index])], int(choices[2 * index + 1])
+            )
+        return not failed
 
     def play_turn(self) -> Tuple[TurnResult, Dict]:
         """Joue un tour complet pour le joueur actuel et retourne le résultat avec les détails"""
         current_player = self.get_current_player()
-        turn_state = TurnState()
+        turn_state = TurnState(dice=self._dice)
         self.turn_number += 1
         
         # Créer l'état du jeu avant le tour
-        game_state_before = self._create_game_state_snapshot()
+        record_history = self.record_history
+        game_state_before = (
+            self._create_game_state_snapshot() if record_history else None
+        )
         
         turn_details = {
             "player": current_player.name,
@@ -328,64 +1042,77 @@ class PikominoGame:
 
         dice_rolls = []  # Pour l'historique structuré
 
-        while turn_state.remaining_dice > 0:
-            # Lancer les dés
-            turn_state.current_roll = [
-                Dice.roll() for _ in range(turn_state.remaining_dice)
-            ]
-            dice_rolls.append(list(turn_state.current_roll))  # Copie pour l'historique
-            
-            turn_details["rolls"].append(
-                {
-                    "dice": [dice.name for dice in turn_state.current_roll],
-                    "remaining": turn_state.remaining_dice,
-                }
-            )
-
-            # Construire le contexte et le joueur choisit une valeur
-            context = self._build_game_context(turn_state)
-            chosen_value = current_player.choose_dice_value(context)
+        # Phase de dés compilée pour les stratégies simples, hors historique et
+        # hors dés remplacés (tests)
+        kernel = None
+        if not record_history and type(current_player) is Player and Dice.roll is roll_die:
+            strategy_type = type(current_player.strategy)
+            kernel = _TURN_KERNELS.get(strategy_type)
+            if strategy_type in _CONTEXT_TURN_KERNELS:
+                kernel = current_player.strategy.compiled_turn(
+                    self._build_decision_context(turn_state)
+                )
 
-            if chosen_value is None or not turn_state.can_reserve_value(chosen_value):
-                # Aucune valeur valide disponible
-                self.handle_failed_turn()
+        if kernel is not None:
+            if not self._play_compiled_dice_phase(turn_state, kernel):
+                self.handle_failed_turn(current_player)
                 turn_details["result"] = TurnResult.FAILED_NO_VALID_CHOICE
-                self.turn_history.append(turn_details)
-                
-                # Créer l'entrée d'historique structuré
-                game_state_after = self._create_game_state_snapshot(turn_details)
-                turn_history_entry = TurnHistory(
-                    turn_number=self.turn_number,
-                    player_name=current_player.name,
-                    dice_rolls=dice_rolls,
-                    reserved_dice=turn_state.reserved_dice,
-                    final_score=turn_state.get_total_score(),
-                    final_has_worm=turn_state.has_worm(),
-                    tile_taken=None,
-                    result=TurnResult.FAILED_NO_VALID_CHOICE,
-                    game_state_before=game_state_before,
-                    game_state_after=game_state_after
+                self._record_turn(
+                    current_player, turn_state, dice_rolls, game_state_before,
+                    turn_details, TurnResult.FAILED_NO_VALID_CHOICE, None
                 )
-                self.game_history.add_turn(turn_history_entry)
-                
+
                 return TurnResult.FAILED_NO_VALID_CHOICE, turn_details
+        else:
+            # Décisions résolues une fois par tour : appel direct aux méthodes de la
+            # stratégie, sans repasser par Player ni recréer de méthode liée à chaque dé
+            strategy = current_player.strategy
+            if type(current_player) is Player and strategy:
+                choose_dice_value = strategy.choose_dice_value
+                should_continue_turn = strategy.should_continue_turn
+            else:
+                choose_dice_value = current_player.choose_dice_value
+                should_continue_turn = current_player.should_continue_turn
+
+            while turn_state.remaining_dice > 0:
+                # Lancer les dés
+                turn_state.roll_dice()
+                if record_history:
+                    roll = turn_state.roll_faces()
+                    dice_rolls.append(roll)  # Faces brutes : un octet par dé
+                    roll_details = {
+                        "remaining": turn_state.remaining_dice,
+                        "dice": [_VALUE_NAMES[face] for face in roll],
+                    }
+                    turn_details["rolls"].append(roll_details)
+
+                # Construire le contexte et le joueur choisit une valeur
+                context = self._build_decision_context(turn_state)
+                chosen_value = choose_dice_value(context)
+
+                if chosen_value is None or not turn_state.can_reserve_value(chosen_value):
+                    # Aucune valeur valide disponible
+                    self.handle_failed_turn(current_player)
+                    turn_details["result"] = TurnResult.FAILED_NO_VALID_CHOICE
+                    self._record_turn(
+                        current_player, turn_state, dice_rolls, game_state_before,
+                        turn_details, TurnResult.FAILED_NO_VALID_CHOICE, None
+                    )
+                
+                    return TurnResult.FAILED_NO_VALID_CHOICE, turn_details
 
-            # Réserver tous les dés de cette valeur
-            count = turn_state.current_roll.count(chosen_value)
-            turn_state.reserved_dice[chosen_value] = (
-                turn_state.reserved_dice.get(chosen_value, 0) + count
-            )
-            turn_state.used_values.add(chosen_value)
-            turn_state.remaining_dice -= count
+                # Réserver tous les dés de cette valeur
+                count = turn_state.reserve(chosen_value)
 
-            turn_details["rolls"][-1]["chosen_value"] = chosen_value.name
-            turn_details["rolls"][-1]["chosen_count"] = count
+                if record_history:
+                    roll_details["chosen_value"] = _VALUE_NAMES[chosen_value]
+                    roll_details["chosen_count"] = count
 
-            # Vérifier si le joueur veut continuer
-            if turn_state.remaining_dice > 0:
-                context = self._build_game_context(turn_state)
-                if not current_player.should_continue_turn(context):
-                    break
+                # Vérifier si le joueur veut continuer
+                if turn_state.remaining_dice > 0:
+                    context = self._build_decision_context(turn_state)
+                    if not should_continue_turn(context):
+                        break
 
         # Fin du tour : essayer de prendre une tuile
         score = turn_state.get_total_score()
@@ -393,90 +1120,52 @@ class PikominoGame:
 
         turn_details["final_score"] = score
         turn_details["final_has_worm"] = has_worm
-        turn_details["reserved_dice"] = {
-            k.name: v for k, v in turn_state.reserved_dice.items()
-        }
+        if record_history:
+            turn_details["reserved_dice"] = {
+                _VALUE_NAMES[k]: v for k, v in turn_state.reserved_dice.items()
+            }
 
         if not has_worm:
-            self.handle_failed_turn()
+            self.handle_failed_turn(current_player)
             turn_details["result"] = TurnResult.FAILED_NO_WORM
-            self.turn_history.append(turn_details)
-            
-            # Créer l'entrée d'historique structuré
-            game_state_after = self._create_game_state_snapshot(turn_details)
-            turn_history_entry = TurnHistory(
-                turn_number=self.turn_number,
-                player_name=current_player.name,
-                dice_rolls=dice_rolls,
-                reserved_dice=turn_state.reserved_dice,
-                final_score=score,
-                final_has_worm=has_worm,
-                tile_taken=None,
-                result=TurnResult.FAILED_NO_WORM,
-                game_state_before=game_state_before,
-                game_state_after=game_state_after
+            self._record_turn(
+                current_player, turn_state, dice_rolls, game_state_before,
+                turn_details, TurnResult.FAILED_NO_WORM, None
             )
-            self.game_history.add_turn(turn_history_entry)
             
             return TurnResult.FAILED_NO_WORM, turn_details
 
-        tile_to_take = self.find_tile_to_take(score, has_worm, turn_state)
+        tile_to_take = self.find_tile_to_take(score, has_worm, turn_state, current_player)
         if tile_to_take is None:
-            self.handle_failed_turn()
+            self.handle_failed_turn(current_player)
             turn_details["result"] = TurnResult.FAILED_INSUFFICIENT_SCORE
-            self.turn_history.append(turn_details)
-            
-            # Créer l'entrée d'historique structuré
-            game_state_after = self._create_game_state_snapshot(turn_details)
-            turn_history_entry = TurnHistory(
-                turn_number=self.turn_number,
-                player_name=current_player.name,
-                dice_rolls=dice_rolls,
-                reserved_dice=turn_state.reserved_dice,
-                final_score=score,
-                final_has_worm=has_worm,
-                tile_taken=None,
-                result=TurnResult.FAILED_INSUFFICIENT_SCORE,
-                game_state_before=game_state_before,
-                game_state_after=game_state_after
+            self._record_turn(
+                current_player, turn_state, dice_rolls, game_state_before,
+                turn_details, TurnResult.FAILED_INSUFFICIENT_SCORE, None
             )
-            self.game_history.add_turn(turn_history_entry)
             
             return TurnResult.FAILED_INSUFFICIENT_SCORE, turn_details
 
-        self.take_tile(tile_to_take)
+        self.take_tile(tile_to_take, current_player)
         turn_details["tile_taken"] = {
             "value": tile_to_take.value,
             "worms": tile_to_take.worms,
         }
         turn_details["result"] = TurnResult.SUCCESS
-        self.turn_history.append(turn_details)
-        
-        # Créer l'entrée d'historique structuré
-        game_state_after = self._create_game_state_snapshot(turn_details)
-        turn_history_entry = TurnHistory(
-            turn_number=self.turn_number,
-            player_name=current_player.name,
-            dice_rolls=dice_rolls,
-            reserved_dice=turn_state.reserved_dice,
-            final_score=score,
-            final_has_worm=has_worm,
-            tile_taken=tile_to_take,
-            result=TurnResult.SUCCESS,
-            game_state_before=game_state_before,
-            game_state_after=game_state_after
+        self._record_turn(
+            current_player, turn_state, dice_rolls, game_state_before,
+            turn_details, TurnResult.SUCCESS, tile_to_take
         )
-        self.game_history.add_turn(turn_history_entry)
         
         return TurnResult.SUCCESS, turn_details
 
     def is_game_over(self) -> bool:
         """Vérifie si la partie est terminée"""
-        return len(self.tiles_center) == 0
+        return not self.center_mask
 
     def get_winner(self) -> Player:
         """Retourne le joueur gagnant"""
-        return max(self.players, key=lambda p: p.get_score())
+        return max(self.players, key=_player_score)
 
     def play_game(self) -> Player:
         """Joue une partie complète et retourne le gagnant"""
@@ -486,9 +1175,31 @@ class PikominoGame:
 
         return self.get_winner()
 
+    def _state_key(self) -> Tuple:
+        """Clé résumant tout ce que lit get_game_state : numéro de tour, joueur courant,
+        tuiles du centre et retirées, hauteur et dessus de chaque pile, historique"""
+        return (
+            self.turn_number,
+            self.current_player_idx,
+            self.center_mask,
+            len(self.removed_tiles),
+            len(self.turn_history),
+            tuple((len(player.tiles), player.top_value) for player in self.players),
+        )
+
     def get_game_state(self) -> Dict:
-        """Retourne l'état actuel du jeu"""
-        return {
+        """Retourne l'état actuel du jeu
+
+        L'état est relu seulement si la clé de l'état (_state_key) a changé, y compris
+        quand les tuiles ou les piles sont modifiées directement. Chaque appel renvoie
+        une copie complète (listes et dictionnaires imbriqués compris) : l'appelant peut
+        la modifier sans toucher à l'état mémorisé.
+        """
+        key = self._state_key()
+        cached = self._state_cache
+        if cached is not None and cached[0] == key:
+            return _copy_game_state(cached[1])
+        state = {
             "current_player": self.get_current_player().name,
             "current_player_idx": self.current_player_idx,
             "tiles_remaining": len(self.tiles_center),
@@ -502,24 +1213,98 @@ class PikominoGame:
             },
             "player_tile_counts": {p.name: len(p.tiles) for p in self.players},
             "game_over": self.is_game_over(),
-            "turn_count": len(self.turn_history),
+            "turn_count": len(self.turn_history) if self.record_history else self.turn_number,
             "turn_number": self.turn_number,
         }
+        self._state_cache = (key, state)
+        return _copy_game_state(state)
 
 
-def simulate_game(
-    player_names: List[str], strategies: List[GameStrategy] = None
-) -> Dict:
-    """Simule une partie avec les joueurs et stratégies donnés"""
+def _copy_game_state(state: Dict) -> Dict:
+    """Copie complète d'un état renvoyé par get_game_state (tuiles et dictionnaires)"""
+    return {
+        **state,
+        "tiles_center": [dict(tile) for tile in state["tiles_center"]],
+        "player_scores": state["player_scores"].copy(),
+        "player_tiles": {
+            name: [dict(tile) for tile in tiles]
+            for name, tiles in state["player_tiles"].items()
+        },
+        "player_tile_counts": state["player_tile_counts"].copy(),
+    }
+
+
+def _new_game(
+    player_names: List[str],
+    strategies: Optional[List[GameStrategy]],
+    record_history: bool,
+    seed: Optional[int],
+) -> PikominoGame:
+    """Crée une partie, avec son propre générateur si une graine est donnée"""
     if strategies is None:
-        from strategies import ConservativeStrategy
-        strategies = [ConservativeStrategy() for _ in player_names]
+        strategies = [ConservativeStrategy()] * len(player_names)
 
     players = [
         Player(name, strategy) for name, strategy in zip(player_names, strategies)
     ]
-    game = PikominoGame(players)
+    rng = random.Random(seed) if seed is not None else None
+    return PikominoGame(players, record_history=record_history, rng=rng)
+
+
+# Arguments des noyaux de partie (identifiants, seuils) par combinaison de types de
+# stratégies, préparés une seule fois ; None si une stratégie n'a pas de noyau
+_GAME_KERNEL_ARGS: Dict[Tuple[type, ...], Optional[Tuple]] = {}
+
+
+def _game_kernel_args(strategies: List[Optional[GameStrategy]]) -> Optional[Tuple]:
+    """Retourne les arguments du noyau de partie pour ces stratégies, ou None"""
+    key = tuple(type(strategy) for strategy in strategies)
+    if key not in _GAME_KERNEL_ARGS:
+        kernels = [_TURN_KERNELS.get(strategy_type) for strategy_type in key]
+        if None in kernels:
+            _GAME_KERNEL_ARGS[key] = None
+        else:
+            as_ints = load_kernels().as_ints
+            _GAME_KERNEL_ARGS[key] = (
+                as_ints([strategy_id for strategy_id, _ in kernels]),
+                as_ints([threshold for _, threshold in kernels]),
+            )
+    return _GAME_KERNEL_ARGS[key]
+
+
+def simulate_game(
+    player_names: List[str],
+    strategies: List[GameStrategy] = None,
+    record_history: bool = False,
+    seed: Optional[int] = None,
+) -> Dict:
+    """Simule une partie avec les joueurs et stratégies donnés
+
+    Sans historique ni graine, une partie entre stratégies prises en charge par le
+    noyau compilé (voir simulate_games) y est jouée entièrement.
+    """
+    if strategies is None:
+        strategies = [ConservativeStrategy()] * len(player_names)
+
+    kernel_args = None
+    if not record_history and seed is None:
+        kernel_args = _game_kernel_args(strategies)
+    if kernel_args is not None:
+        # Partie entière dans le noyau : ni joueurs ni PikominoGame à construire
+        kernels = load_kernels()
+        count = len(player_names)
+        outcome = kernels.as_ints([0] * (2 * count))
+        winner_index = kernels.play_game_core(*kernel_args, random.getrandbits(32), outcome)
+        return {
+            "winner": player_names[winner_index],
+            "final_scores": {name: int(outcome[i]) for i, name in enumerate(player_names)},
+            "final_tiles": {
+                name: int(outcome[count + i]) for i, name in enumerate(player_names)
+            },
+        }
 
+    game = _new_game(player_names, strategies, record_history, seed)
+    players = game.players
     winner = game.play_game()
 
     return {
@@ -527,3 +1312,49 @@ def simulate_game(
         "final_scores": {p.name: p.get_score() for p in players},
         "final_tiles": {p.name: len(p.tiles) for p in players},
     }
+
+
+def simulate_games(
+    player_names: List[str],
+    strategies: List[GameStrategy] = None,
+    num_games: int = 1000,
+    seed: int = 0,
+) -> Dict[str, int]:
+    """Simule un lot de parties indépendantes avec le noyau compilé et compte les victoires
+
+    Seules les stratégies jouées par le noyau sont acceptées : joueur sans stratégie,
+    ConservativeStrategy, AggressiveStrategy et BalancedStrategy. Les parties utilisent leur propre
+    générateur (graines seed à seed + num_games - 1), pas celui de simulate_game.
+    """
+    if strategies is None:
+        strategies = [ConservativeStrategy()] * len(player_names)
+
+    kernel_args = _game_kernel_args(strategies)
+    if kernel_args is None:
+        unsupported = next(s for s in strategies if type(s) not in _TURN_KERNELS)
+        raise ValueError(
+            f"Stratégie non prise en charge par la simulation en lot: {type(unsupported).__name__}"
+        )
+
+    winners = load_kernels().simulate_games_batch(*kernel_args, num_games, seed)
+    wins = dict.fromkeys(player_names, 0)
+    for winner in winners:
+        wins[player_names[winner]] += 1
+    return wins
+
+
+def replay_game(
+    player_names: List[str],
+    strategies: List[GameStrategy] = None,
+    seed: int = 0,
+) -> PikominoGame:
+    """Rejoue la partie simulée avec cette graine, historiques activés, pour l'inspecter
+
+    La graine fixe la suite de faces de la partie, lue de la même façon que les tours
+    soient joués par le noyau compilé (sans historique) ou en Python (avec) ; une
+    RandomStrategy doit recevoir son propre générateur (rng), dans le même état, pour
+    que ses choix soient eux aussi rejoués à l'identique.
+    """
+    game = _new_game(player_names, strategies, True, seed)
+    game.play_game()
+    return game
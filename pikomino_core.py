@@ -0,0 +1,501 @@
+"""
+Noyaux de calcul bas niveau pour les simulations Pikomino
+
+Ces fonctions travaillent uniquement sur des entiers (faces 1-6, masques de bits)
+pour pouvoir être compilées par numba lorsqu'il est installé. Sans numba, elles
+s'exécutent telles quelles en Python pur.
+"""
+
+import os
+import random
+
+# Constantes de règles, définies sans dépendance dans pikomino_rules et réexportées
+from pikomino_rules import (
+    POINT_VALUE,
+    WORM_FACE,
+    BYTE_TO_FACE,
+    REJECTED_BYTES,
+    MAX_FACES_PER_TURN,
+    DEFAULT_STRATEGY,
+    CONSERVATIVE_STRATEGY,
+    AGGRESSIVE_STRATEGY,
+    BALANCED_STRATEGY,
+    OPTIMAL_STRATEGY,
+    OPTIMAL_TRAILING_STRATEGY,
+    optimal_target as _optimal_target,
+)
+
+# Cache de compilation numba à côté du module, réutilisé d'une exécution à l'autre
+os.environ.setdefault(
+    "NUMBA_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".numba_cache")
+)
+
+try:
+    import numpy as np
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba est optionnel : repli sur le Python pur
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Décorateur neutre utilisé quand numba n'est pas disponible"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Points de chaque face empaquetés en ordre inverse (face 6 à l'octet 0, face 0 à l'octet 6)
+_PACKED_POINT_WEIGHTS = sum(POINT_VALUE[6 - lane] << (8 * lane) for lane in range(7))
+
+# Signatures explicites : les noyaux sont compilés au chargement du module (ou relus
+# depuis le cache disque) plutôt qu'au premier appel, hors des boucles chronométrées
+_SIMULATE_TURN_SIGNATURE = "Tuple((int64, boolean, int64))(uint8[::1], int64, int64)"
+_COUNT_TURNS_SIGNATURE = "int64(uint8[::1], int64, int64)"
+_PLAY_TURN_SIGNATURE = (
+    "Tuple((int64, boolean, int64))(uint8[::1], int64, int64, int64, uint8[::1])"
+)
+
+_BALANCED_TARGET_SIGNATURE = (
+    "Tuple((int64, int64))(int64, int64, int64, int64, int64, int64[::1], int64)"
+)
+_PLAY_GAME_SIGNATURE = "int64(int64[::1], int64[::1], int64, int64[::1])"
+_RUN_GAME_SIGNATURE = "int64(int64[::1], int64[::1], int64)"
+_SIMULATE_GAMES_SIGNATURE = "int64[::1](int64[::1], int64[::1], int64, int64)"
+
+
+def as_faces(faces):
+    """Convertit une suite de faces au format attendu par les noyaux"""
+    if NUMBA_AVAILABLE:
+        return np.frombuffer(bytearray(faces), dtype=np.uint8)
+    return faces
+
+
+def as_ints(values):
+    """Convertit une suite d'entiers au format attendu par les noyaux"""
+    if NUMBA_AVAILABLE:
+        return np.array(values, dtype=np.int64)
+    return list(values)
+
+
+def new_choices():
+    """Tampon de sortie de play_turn_core : (face, nombre) pour chaque réservation"""
+    if NUMBA_AVAILABLE:
+        return np.zeros(16, dtype=np.uint8)
+    return bytearray(16)
+
+
+# Tampons des noyaux : tableaux numpy compilés, ou bytearray/list en Python pur
+if NUMBA_AVAILABLE:
+    @njit("uint8[::1](int64)", cache=True)
+    def _new_faces(size):
+        return np.zeros(size, dtype=np.uint8)
+
+    @njit("int64[::1](int64)", cache=True)
+    def _new_ints(size):
+        return np.zeros(size, dtype=np.int64)
+else:
+    def _new_faces(size):
+        return bytearray(size)
+
+    def _new_ints(size):
+        return [0] * size
+
+
+def roll_faces(size: int, rng=random):
+    """Tire environ `size` faces uniformes en un seul appel au générateur"""
+    return as_faces(rng.randbytes(size).translate(BYTE_TO_FACE, REJECTED_BYTES))
+
+
+@njit("int64(int64)", cache=True)
+def score_from_packed(packed):
+    """Score de dés comptés dans un entier empaqueté (8 bits par face, face n à l'octet n)
+
+    Le produit par les points empaquetés en ordre inverse accumule la somme des
+    comptes × points dans l'octet 6 ; aucun octet ne déborde (au plus 8 dés à 5 points).
+    """
+    return ((packed * _PACKED_POINT_WEIGHTS) >> 48) & 0xFF
+
+
+@njit(_SIMULATE_TURN_SIGNATURE, cache=True)
+def simulate_turn(faces, cursor, continue_threshold):
+    """Simule un tour de la stratégie par défaut sur des faces pré-tirées
+
+    À chaque lancer, réserve la valeur non utilisée la plus fréquente et s'arrête
+    dès que le score atteint `continue_threshold`. Retourne (score, has_worm, cursor) ;
+    un score nul signale un tour raté faute de valeur réservable.
+    Les comptes par face sont empaquetés dans un entier (8 bits par face).
+    """
+    remaining = 8
+    used = 0
+    reserved = 0
+    score = 0
+    while remaining > 0:
+        start = cursor
+        rolled = 0
+        for _ in range(remaining):
+            rolled += 1 << (int(faces[cursor]) << 3)
+            cursor += 1
+
+        best = 0
+        best_count = 0
+        # Faces dans l'ordre du lancer : la première lancée l'emporte en cas d'égalité
+        for index in range(start, cursor):
+            face = int(faces[index])
+            count = (rolled >> (face << 3)) & 0xFF
+            if count > best_count and not (used >> face) & 1:
+                best = face
+                best_count = count
+        if best == 0:
+            return 0, False, cursor
+
+        used |= 1 << best
+        remaining -= best_count
+        reserved += best_count << (best << 3)
+        score = score_from_packed(reserved)
+        if remaining > 0 and score >= continue_threshold:
+            break
+    return score, (used >> WORM_FACE) & 1 == 1, cursor
+
+
+# Cible de la stratégie optimale, compilée pour être appelée depuis play_turn_core
+optimal_target = njit("int64(int64, int64)", cache=True)(_optimal_target)
+
+
+@njit(_PLAY_TURN_SIGNATURE, cache=True)
+def play_turn_core(faces, cursor, strategy_id, threshold, choices):
+    """Joue la phase de dés d'un tour pour une stratégie identifiée par un entier
+
+    Les réservations successives sont écrites dans `choices` (face, nombre).
+    Retourne (nombre de réservations, tour raté faute de valeur réservable, cursor).
+    L'appelant garantit au moins MAX_FACES_PER_TURN faces après `cursor`.
+    """
+    remaining = 8
+    used = 0
+    reserved = 0
+    reservations = 0
+    while remaining > 0:
+        start = cursor
+        rolled = 0
+        for _ in range(remaining):
+            rolled += 1 << (int(faces[cursor]) << 3)
+            cursor += 1
+
+        # Les faces sont parcourues dans l'ordre du lancer : à égalité, la première
+        # lancée l'emporte (comme le max() Python sur les valeurs lancées)
+        best = 0
+        best_count = 0
+        worm_count = (rolled >> (WORM_FACE << 3)) & 0xFF
+        if strategy_id == BALANCED_STRATEGY:
+            if worm_count > 0 and not (used >> WORM_FACE) & 1 and remaining > 4:
+                # Un ver d'abord, tant qu'il reste beaucoup de dés
+                best = WORM_FACE
+                best_count = worm_count
+            elif remaining <= 3:
+                # Peu de dés : la face haute (4 à ver) qui rapporte le plus
+                best_points = 0
+                for index in range(start, cursor):
+                    face = int(faces[index])
+                    count = (rolled >> (face << 3)) & 0xFF
+                    if face >= 4 and not (used >> face) & 1 and POINT_VALUE[face] > best_points:
+                        best = face
+                        best_count = count
+                        best_points = POINT_VALUE[face]
+            if best == 0:
+                # Fréquence × points
+                best_total = 0
+                for index in range(start, cursor):
+                    face = int(faces[index])
+                    count = (rolled >> (face << 3)) & 0xFF
+                    if not (used >> face) & 1 and count * POINT_VALUE[face] > best_total:
+                        best = face
+                        best_count = count
+                        best_total = count * POINT_VALUE[face]
+        elif strategy_id == OPTIMAL_STRATEGY or strategy_id == OPTIMAL_TRAILING_STRATEGY:
+            if worm_count > 0 and not (used >> WORM_FACE) & 1:
+                # Un ver d'abord, tant qu'on n'en a pas
+                best = WORM_FACE
+                best_count = worm_count
+            elif remaining <= 3:
+                # Peu de dés : la face qui rapporte le plus
+                best_points = 0
+                for index in range(start, cursor):
+                    face = int(faces[index])
+                    count = (rolled >> (face << 3)) & 0xFF
+                    if not (used >> face) & 1 and POINT_VALUE[face] > best_points:
+                        best = face
+                        best_count = count
+                        best_points = POINT_VALUE[face]
+            else:
+                # Fréquence × points + (fréquence - 1) / 2, +1 aux faces 5 et ver en
+                # retard ; calculé au double pour rester en entiers
+                best_total = -1
+                for index in range(start, cursor):
+                    face = int(faces[index])
+                    count = (rolled >> (face << 3)) & 0xFF
+                    if not (used >> face) & 1:
+                        total = 2 * count * POINT_VALUE[face] + count - 1
+                        if strategy_id == OPTIMAL_TRAILING_STRATEGY and face >= 5:
+                            total += 2
+                        if total > best_total:
+                            best = face
+                            best_count = count
+                            best_total = total
+        elif strategy_id == AGGRESSIVE_STRATEGY:
+            # La plus haute face disponible (le ver d'abord)
+            for face in range(6, 0, -1):
+                count = (rolled >> (face << 3)) & 0xFF
+                if count > 0 and not (used >> face) & 1:
+                    best = face
+                    best_count = count
+                    break
+        else:
+            if (strategy_id == CONSERVATIVE_STRATEGY and worm_count > 0
+                    and not (used >> WORM_FACE) & 1):
+                best = WORM_FACE
+                best_count = worm_count
+            else:
+                # La face disponible la plus fréquente
+                for index in range(start, cursor):
+                    face = int(faces[index])
+                    count = (rolled >> (face << 3)) & 0xFF
+                    if count > best_count and not (used >> face) & 1:
+                        best = face
+                        best_count = count
+        if best == 0:
+            return reservations, True, cursor
+
+        choices[2 * reservations] = best
+        choices[2 * reservations + 1] = best_count
+        reservations += 1
+        used |= 1 << best
+        remaining -= best_count
+        reserved += best_count << (best << 3)
+        if remaining > 0:
+            score = score_from_packed(reserved)
+            if strategy_id == CONSERVATIVE_STRATEGY:
+                stop = score >= threshold and (used >> WORM_FACE) & 1 == 1
+            elif strategy_id == BALANCED_STRATEGY:
+                # Continue avec 4 dés ou plus sous 28 points, sinon s'arrête dès
+                # qu'une tuile est prenable
+                can_take = score >= 21 and (used >> WORM_FACE) & 1 == 1
+                stop = can_take and not (remaining >= 4 and score < 28)
+            elif strategy_id == OPTIMAL_STRATEGY or strategy_id == OPTIMAL_TRAILING_STRATEGY:
+                can_take = score >= 21 and (used >> WORM_FACE) & 1 == 1
+                stop = can_take and score >= optimal_target(threshold, remaining)
+            else:
+                stop = score >= threshold
+            if stop:
+                break
+    return reservations, False, cursor
+
+
+# Générateur xorshift32 des parties en lot : état entier local à chaque partie, donc
+# reproductible et sans partage entre fils ; résultats identiques compilé ou non
+_RNG_MASK = 0xFFFFFFFF
+_RNG_LIMIT = 4294967292  # Plus grand multiple de 6 <= 2**32 (tirages au-delà écartés)
+
+# Faces tirées d'avance pour une partie en lot, regénérées quand il en manque
+_GAME_FACES = 4096
+
+# Tuiles 21 à 36 du centre en début de partie, une par bit
+_FULL_CENTER = ((1 << 37) - 1) & ~((1 << 21) - 1)
+
+
+@njit("int64(int64)", cache=True)
+def _seed_state(seed):
+    """Mélange la graine d'une partie en un état xorshift32 non nul"""
+    state = seed & _RNG_MASK
+    state ^= state >> 16
+    state = (state * 0x7FEB352D) & _RNG_MASK
+    state ^= state >> 15
+    state = (state * 0x846CA68B) & _RNG_MASK
+    state ^= state >> 16
+    return state if state != 0 else 1
+
+
+@njit("int64(uint8[::1], int64)", cache=True)
+def fill_faces(faces, state):
+    """Remplit `faces` de faces uniformes avec xorshift32 et retourne le nouvel état"""
+    for index in range(len(faces)):
+        while True:
+            state ^= (state << 13) & _RNG_MASK
+            state ^= state >> 17
+            state ^= (state << 5) & _RNG_MASK
+            if state < _RNG_LIMIT:
+                break
+        faces[index] = state % 6 + 1
+    return state
+
+
+@njit("int64(int64)", cache=True)
+def tile_worms(value):
+    """Nombre de vers d'une tuile (21-24 : 1, 25-28 : 2, 29-32 : 3, 33-36 : 4)"""
+    return (value - 17) >> 2
+
+
+@njit(_BALANCED_TARGET_SIGNATURE, cache=True)
+def _balanced_target(center, score, victim, lowest, highest, scores, player):
+    """Tuile visée par la stratégie équilibrée : retourne (tuile, victime ou -1)
+
+    En retard : le vol ; en avance : la tuile médiane du centre accessible ;
+    sinon le vol (un ver de plus que toute tuile du centre accessible), à défaut
+    la plus basse tuile du centre au nombre de vers maximal.
+    """
+    best_other = 0
+    for other in range(len(scores)):
+        if other != player and scores[other] > best_other:
+            best_other = scores[other]
+    own = scores[player]
+    if own < best_other and victim >= 0:
+        return score, victim
+    if own > best_other and lowest != 0:
+        available = 0
+        for value in range(lowest, highest + 1):
+            available += (center >> value) & 1
+        middle = available // 2
+        for value in range(lowest, highest + 1):
+            if (center >> value) & 1:
+                if middle == 0:
+                    return value, -1
+                middle -= 1
+    if victim >= 0:
+        return score, victim
+    if highest == 0:
+        return 0, -1
+    worms = tile_worms(highest)
+    for value in range(lowest, highest + 1):
+        if (center >> value) & 1 and tile_worms(value) == worms:
+            return value, -1
+    return highest, -1
+
+
+@njit(_PLAY_GAME_SIGNATURE, cache=True)
+def play_game_core(strategy_ids, thresholds, seed, outcome):
+    """Joue une partie complète entre stratégies identifiées par un entier
+
+    Mêmes règles que PikominoGame : un tour raté coûte la tuile du dessus et retire
+    la plus haute tuile du centre ; la partie s'arrête quand le centre est vide.
+    `outcome` reçoit les scores des joueurs puis leurs nombres de tuiles.
+    Retourne l'indice du gagnant (le premier en cas d'égalité).
+    """
+    num_players = len(strategy_ids)
+    stacks = _new_ints(num_players * 16)
+    heights = _new_ints(num_players)
+    scores = _new_ints(num_players)
+    faces = _new_faces(_GAME_FACES)
+    choices = _new_faces(16)
+    state = fill_faces(faces, _seed_state(seed))
+    cursor = 0
+    center = _FULL_CENTER
+    player = 0
+    while center != 0:
+        if cursor + MAX_FACES_PER_TURN > _GAME_FACES:
+            state = fill_faces(faces, state)
+            cursor = 0
+        strategy_id = strategy_ids[player]
+        reservations, failed, cursor = play_turn_core(
+            faces, cursor, strategy_id, thresholds[player], choices
+        )
+
+        tile = 0
+        victim = -1
+        if not failed:
+            reserved = 0
+            has_worm = False
+            for index in range(reservations):
+                face = int(choices[2 * index])
+                reserved += int(choices[2 * index + 1]) << (face << 3)
+                if face == WORM_FACE:
+                    has_worm = True
+            score = score_from_packed(reserved)
+            if has_worm:
+                # Tuile volable : dessus de pile d'un adversaire égal au score
+                for other in range(num_players):
+                    if (other != player and heights[other] > 0
+                            and stacks[other * 16 + heights[other] - 1] == score):
+                        victim = other
+                        break
+                lowest = 0
+                highest = 0
+                for value in range(21, min(score, 36) + 1):
+                    if (center >> value) & 1:
+                        if lowest == 0:
+                            lowest = value
+                        highest = value
+                if strategy_id == CONSERVATIVE_STRATEGY and lowest != 0:
+                    # Le centre d'abord, tuile la plus basse
+                    tile = lowest
+                    victim = -1
+                elif strategy_id == BALANCED_STRATEGY:
+                    tile, victim = _balanced_target(
+                        center, score, victim, lowest, highest, scores, player
+                    )
+                elif victim >= 0:
+                    tile = score
+                else:
+                    tile = highest
+
+        if tile == 0:
+            if heights[player] > 0:
+                heights[player] -= 1
+                scores[player] -= tile_worms(stacks[player * 16 + heights[player]])
+            for value in range(36, 20, -1):
+                if (center >> value) & 1:
+                    center &= ~(1 << value)
+                    break
+        else:
+            if victim >= 0:
+                heights[victim] -= 1
+                scores[victim] -= tile_worms(tile)
+            else:
+                center &= ~(1 << tile)
+            stacks[player * 16 + heights[player]] = tile
+            heights[player] += 1
+            scores[player] += tile_worms(tile)
+        player = (player + 1) % num_players
+
+    winner = 0
+    for other in range(num_players):
+        outcome[other] = scores[other]
+        outcome[num_players + other] = heights[other]
+        if scores[other] > scores[winner]:
+            winner = other
+    return winner
+
+
+@njit(_RUN_GAME_SIGNATURE, cache=True)
+def run_game(strategy_ids, thresholds, seed):
+    """Joue une partie complète et retourne seulement l'indice du gagnant"""
+    return play_game_core(strategy_ids, thresholds, seed, _new_ints(2 * len(strategy_ids)))
+
+
+@njit(_SIMULATE_GAMES_SIGNATURE, parallel=True, cache=True)
+def simulate_games_batch(strategy_ids, thresholds, num_games, base_seed):
+    """Joue `num_games` parties indépendantes (graines base_seed + i) en parallèle"""
+    winners = _new_ints(num_games)
+    for game in prange(num_games):
+        winners[game] = run_game(strategy_ids, thresholds, base_seed + game)
+    return winners
+
+
+@njit(_COUNT_TURNS_SIGNATURE, cache=True)
+def count_successful_turns(faces, num_turns, continue_threshold):
+    """Compte les tours permettant de prendre une tuile (score >= 21 avec un ver)"""
+    cursor = 0
+    successes = 0
+    for _ in range(num_turns):
+        score, has_worm, cursor = simulate_turn(faces, cursor, continue_threshold)
+        if has_worm and score >= 21:
+            successes += 1
+    return successes
+
+
+def turn_success_rate(num_turns: int, continue_threshold: int = 25, rng=random) -> float:
+    """Estime la probabilité de réussir un tour avec la stratégie par défaut"""
+    # Marge pour les octets rejetés lors de la conversion en faces
+    faces = roll_faces(num_turns * MAX_FACES_PER_TURN * 17 // 16 + 64, rng)
+    while len(faces) < num_turns * MAX_FACES_PER_TURN:
+        faces = roll_faces(num_turns * MAX_FACES_PER_TURN * 5 // 4 + 64, rng)
+    return count_successful_turns(faces, num_turns, continue_threshold) / num_turns
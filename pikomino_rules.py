@@ -0,0 +1,42 @@
+"""
+Constantes de règles partagées par le moteur, les stratégies et les noyaux compilés
+
+Ce module n'a aucune dépendance : pikomino et strategies l'importent sans charger
+numba, que pikomino_core ne charge qu'au premier noyau utilisé.
+"""
+
+# Valeur en points de chaque face, indexée par la face (le ver vaut 5 points)
+POINT_VALUE = (0, 1, 2, 3, 4, 5, 5)
+
+# Face du ver
+WORM_FACE = 6
+
+# Conversion octet aléatoire -> face : les octets 0-251 donnent une face uniforme
+# (b % 6 + 1), les octets 252-255 sont écartés pour ne pas biaiser la distribution
+BYTE_TO_FACE = bytes(b % 6 + 1 for b in range(256))
+REJECTED_BYTES = bytes(range(252, 256))
+
+# Nombre maximal de faces consommées par un tour (8 + 7 + ... + 1)
+MAX_FACES_PER_TURN = 36
+
+# Identifiants des stratégies jouées par play_turn_core
+DEFAULT_STRATEGY = 0
+CONSERVATIVE_STRATEGY = 1
+AGGRESSIVE_STRATEGY = 2
+BALANCED_STRATEGY = 3
+# Optimale : le seuil passé est sa cible de base ; la variante « en retard » ajoute
+# un bonus aux faces 5 et ver dans le choix des dés
+OPTIMAL_STRATEGY = 4
+OPTIMAL_TRAILING_STRATEGY = 5
+
+
+def optimal_target(base_target, remaining):
+    """Score visé par la stratégie optimale selon sa cible de base et les dés restants"""
+    if remaining >= 5:
+        return base_target + 2
+    if remaining >= 3:
+        return base_target
+    if remaining >= 2:
+        return base_target - 3
+    # 1 dé restant : sécuriser immédiatement
+    return 21
@@ -9,35 +9,64 @@ Ce module contient toutes les stratégies de jeu disponibles:
 - TargetedStrategy: Stratégie ciblée configurable
 - RandomStrategy: Stratégie aléatoire
 - OptimalStrategy: Stratégie mathématiquement optimale
+- SearchStrategy: Recherche expectimax sur le tour en cours
+- TableStrategy: Politique expectimax précalculée sur une situation de référence
 """
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Optional, List, Tuple, Dict, Any, TYPE_CHECKING
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from heapq import nsmallest
+from math import factorial
+from operator import attrgetter, methodcaller
 import random
 
+from pikomino_rules import (
+    POINT_VALUE, WORM_FACE, OPTIMAL_STRATEGY, OPTIMAL_TRAILING_STRATEGY, optimal_target,
+)
+
 if TYPE_CHECKING:
-    from pikomino import DiceValue, Tile, Player, TurnState, TurnResult
+    from pikomino import Tile, Player, TurnState, TurnResult
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GameStateSnapshot:
-    """Instantané de l'état du jeu à un moment donné"""
+    """Instantané de l'état du jeu à un moment donné
+
+    Les tuiles sont stockées par valeur, un octet par tuile ; les listes de tuiles
+    sont reconstruites à la lecture à partir des tuiles canoniques.
+    """
     turn_number: int
     current_player_name: str
-    tiles_center: List[Tile]  # Tuiles disponibles dans le centre
-    players_tiles: Dict[str, List[Tile]]  # Tuiles de chaque joueur
-    removed_tiles: List[Tile]  # Tuiles retirées du jeu
+    center_values: bytes  # Valeurs des tuiles disponibles dans le centre
+    players_values: Dict[str, bytes]  # Valeurs des tuiles de chaque joueur (dessus en dernier)
+    removed_values: bytes  # Valeurs des tuiles retirées du jeu
     player_scores: Dict[str, int]  # Score (vers) de chaque joueur
     turn_details: Dict[str, Any]  # Détails du tour en cours
 
-@dataclass 
+    @property
+    def tiles_center(self) -> List[Tile]:
+        """Tuiles disponibles dans le centre"""
+        return tiles_from_values(self.center_values)
+
+    @property
+    def players_tiles(self) -> Dict[str, List[Tile]]:
+        """Tuiles de chaque joueur"""
+        return {name: tiles_from_values(values) for name, values in self.players_values.items()}
+
+    @property
+    def removed_tiles(self) -> List[Tile]:
+        """Tuiles retirées du jeu"""
+        return tiles_from_values(self.removed_values)
+
+@dataclass(slots=True, frozen=True)
 class TurnHistory:
     """Historique d'un tour spécifique"""
     turn_number: int
     player_name: str
-    dice_rolls: List[List[DiceValue]]  # Tous les lancers de dés du tour
+    dice_rolls: List[bytes]  # Tous les lancers du tour, une face brute (1-6) par octet
     reserved_dice: Dict[DiceValue, int]  # Dés finalement réservés
     final_score: int
     final_has_worm: bool
@@ -46,20 +75,36 @@ class TurnHistory:
     game_state_before: GameStateSnapshot  # État du jeu avant le tour
     game_state_after: GameStateSnapshot   # État du jeu après le tour
 
+    def rolls_as_values(self) -> List[List[DiceValue]]:
+        """Reconstruit les lancers sous forme de listes de DiceValue, à la demande"""
+        return [[face_value(face) for face in roll] for roll in self.dice_rolls]
+
 @dataclass
 class GameHistory:
     """Historique complet d'une partie de Pikomino"""
     turns: List[TurnHistory] = field(default_factory=list)
-    game_states: List[GameStateSnapshot] = field(default_factory=list)
+    # Index des tours par joueur, tenu à jour par add_turn
+    _by_player: Dict[str, List[TurnHistory]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        for turn in self.turns:
+            self._by_player.setdefault(turn.player_name, []).append(turn)
     
     def add_turn(self, turn: TurnHistory) -> None:
         """Ajoute un tour à l'historique"""
         self.turns.append(turn)
-        self.game_states.append(turn.game_state_after)
+        self._by_player.setdefault(turn.player_name, []).append(turn)
+    
+    @property
+    def game_states(self) -> List[GameStateSnapshot]:
+        """États du jeu après chaque tour, lus depuis les tours (pas de copie stockée)"""
+        return [turn.game_state_after for turn in self.turns]
     
     def get_player_turns(self, player_name: str) -> List[TurnHistory]:
-        """Retourne tous les tours d'un joueur spécifique"""
-        return [turn for turn in self.turns if turn.player_name == player_name]
+        """Retourne tous les tours d'un joueur spécifique (liste interne, à ne pas modifier)"""
+        return self._by_player.get(player_name, [])
     
     def get_recent_turns(self, count: int = 5) -> List[TurnHistory]:
         """Retourne les N derniers tours"""
@@ -67,59 +112,171 @@ class GameHistory:
     
     def get_player_statistics(self, player_name: str) -> Dict[str, Any]:
         """Calcule des statistiques pour un joueur"""
+        # Un seul passage sur les tours du joueur : pas de listes intermédiaires par filtre
         player_turns = self.get_player_turns(player_name)
-        if not player_turns:
+        total = len(player_turns)
+        if not total:
             return {}
-        
-        successful_turns = [t for t in player_turns if t.result.value == "success"]
-        failed_turns = [t for t in player_turns if t.result.value != "success"]
+        successes = score_sum = worms_sum = 0
+        tiles_taken = []
+        for turn in player_turns:
+            if turn.result.value != "success":
+                continue
+            successes += 1
+            score_sum += turn.final_score
+            tile = turn.tile_taken
+            if tile:
+                worms_sum += tile.worms
+                tiles_taken.append(tile)
         
         return {
-            "total_turns": len(player_turns),
-            "successful_turns": len(successful_turns),
-            "failed_turns": len(failed_turns),
-            "success_rate": len(successful_turns) / len(player_turns) if player_turns else 0,
-            "average_score_on_success": sum(t.final_score for t in successful_turns) / len(successful_turns) if successful_turns else 0,
-            "tiles_taken": [t.tile_taken for t in successful_turns if t.tile_taken],
-            "total_worms_gained": sum(t.tile_taken.worms for t in successful_turns if t.tile_taken)
+            "total_turns": total,
+            "successful_turns": successes,
+            "failed_turns": total - successes,
+            "success_rate": successes / total,
+            "average_score_on_success": score_sum / successes if successes else 0,
+            "tiles_taken": tiles_taken,
+            "total_worms_gained": worms_sum
         }
 
 
-@dataclass
 class GameContext:
-    """Contexte complet du jeu disponible pour les stratégies"""
-    # État du tour actuel
-    turn_state: TurnState
-    current_player: Player
-    
-    # État complet du jeu
-    all_players: List[Player]
-    tiles_center: List[Tile]  # Toutes les tuiles disponibles dans le centre
-    removed_tiles: List[Tile]  # Tuiles retirées du jeu (échecs)
-    
-    # Informations calculées pour faciliter les décisions
-    stealable_tiles: List[Tuple[Tile, Player]]  # Tuiles volables [(tuile, propriétaire)]
-    available_center_tiles: List[Tile]  # Tuiles du centre accessibles avec le score actuel
-    
-    # Historique et statistiques
-    game_history: GameHistory
-    turn_number: int
-    
-    def get_opponent_scores(self) -> Dict[str, int]:
-        """Retourne les scores des adversaires"""
+    """Contexte complet du jeu disponible pour les stratégies
+
+    Les tuiles volables et les tuiles du centre accessibles dépendent du score du tour :
+    si elles ne sont pas fournies, elles sont calculées à la première lecture puis
+    seulement quand le score a changé, ce qui permet de réutiliser le contexte
+    pendant tout un tour. Le moteur réutilise aussi le même contexte d'un tour à
+    l'autre via reset : une stratégie ne doit pas le conserver au-delà d'un appel.
+    """
+
+    def __init__(
+        self,
+        turn_state: TurnState,
+        current_player: Player,
+        all_players: List[Player],
+        tiles_center: List[Tile],
+        removed_tiles: List[Tile],
+        stealable_tiles: Optional[List[Tuple[Tile, Player]]] = None,
+        available_center_tiles: Optional[List[Tile]] = None,
+        game_history: Optional[GameHistory] = None,
+        turn_number: int = 0,
+    ):
+        # Liste réutilisée par le calcul paresseux des tuiles volables
+        self._stealable_buffer: List[Tuple[Tile, Player]] = []
+        self.reset(
+            turn_state, current_player, all_players, tiles_center, removed_tiles,
+            stealable_tiles, available_center_tiles, game_history, turn_number,
+        )
+
+    def reset(
+        self,
+        turn_state: TurnState,
+        current_player: Player,
+        all_players: List[Player],
+        tiles_center: List[Tile],
+        removed_tiles: List[Tile],
+        stealable_tiles: Optional[List[Tuple[Tile, Player]]] = None,
+        available_center_tiles: Optional[List[Tile]] = None,
+        game_history: Optional[GameHistory] = None,
+        turn_number: int = 0,
+    ):
+        """Réinitialise le contexte en place pour un nouveau tour, sans nouvelle allocation"""
+        # État du tour actuel
+        self.turn_state = turn_state
+        self.current_player = current_player
+
+        # État complet du jeu
+        self.all_players = all_players
+        self.tiles_center = tiles_center  # Toutes les tuiles disponibles dans le centre
+        self.removed_tiles = removed_tiles  # Tuiles retirées du jeu (échecs)
+
+        # Informations calculées pour faciliter les décisions (None = calcul paresseux)
+        self._stealable_tiles = stealable_tiles
+        self._available_center_tiles = available_center_tiles
+        self._lazy_tiles = stealable_tiles is None and available_center_tiles is None
+        self._tiles_score: Optional[int] = None
+
+        # Historique et statistiques
+        self.game_history = game_history
+        self.turn_number = turn_number
+
+        # Scores mis en cache par les propriétés du contexte précédent
+        cache = self.__dict__
+        cache.pop("opponent_scores", None)
+        cache.pop("max_opponent_score", None)
+        cache.pop("leading_player", None)
+
+    def _refresh_tiles(self):
+        """Recalcule les tuiles accessibles si le score du tour a changé"""
+        score = self.turn_state.get_total_score()
+        if score == self._tiles_score:
+            return
+        self._tiles_score = score
+        stealable = self._stealable_buffer
+        stealable.clear()
+        for player in self.all_players:
+            if player.top_value == score and player != self.current_player:
+                stealable.append((player.get_top_tile(), player))
+        self._stealable_tiles = stealable
+        up_to = getattr(self.tiles_center, "up_to", None)
+        if up_to is not None:
+            # Centre indexé par valeur : sélection par masque de bits
+            self._available_center_tiles = up_to(score)
+        else:
+            self._available_center_tiles = [t for t in self.tiles_center if t.value <= score]
+
+    @property
+    def stealable_tiles(self) -> List[Tuple[Tile, Player]]:
+        """Tuiles volables [(tuile, propriétaire)] avec le score actuel"""
+        if self._lazy_tiles:
+            self._refresh_tiles()
+        return self._stealable_tiles
+
+    @property
+    def available_center_tiles(self) -> List[Tile]:
+        """Tuiles du centre accessibles avec le score actuel"""
+        if self._lazy_tiles:
+            self._refresh_tiles()
+        return self._available_center_tiles
+
+    # Les scores ne changent pas pendant un tour : calculés une fois par contexte
+    # (le cache est vidé par reset)
+    @cached_property
+    def opponent_scores(self) -> Dict[str, int]:
+        """Scores des adversaires (à ne pas modifier)"""
         return {
             player.name: player.get_score() 
             for player in self.all_players 
             if player != self.current_player
         }
+
+    @cached_property
+    def max_opponent_score(self) -> int:
+        """Meilleur score adverse (0 sans adversaire)"""
+        return max(self.opponent_scores.values(), default=0)
+
+    @cached_property
+    def leading_player(self) -> Player:
+        """Joueur en tête (le premier en cas d'égalité)"""
+        return max(self.all_players, key=_player_score)
+
+    @property
+    def center_tiles_sorted(self) -> bool:
+        """Vrai si available_center_tiles est déjà par valeur croissante (centre indexé)"""
+        return self._lazy_tiles and hasattr(self.tiles_center, "up_to")
+
+    def get_opponent_scores(self) -> Dict[str, int]:
+        """Retourne les scores des adversaires"""
+        return self.opponent_scores
     
     def get_leading_player(self) -> Player:
         """Retourne le joueur en tête"""
-        return max(self.all_players, key=lambda p: p.get_score())
+        return self.leading_player
     
     def is_current_player_leading(self) -> bool:
         """Vérifie si le joueur actuel est en tête"""
-        return self.get_leading_player() == self.current_player
+        return self.leading_player == self.current_player
     
     def get_tiles_by_value_range(self, min_value: int, max_value: int) -> List[Tile]:
         """Retourne les tuiles du centre dans une plage de valeurs"""
@@ -129,9 +286,61 @@ class GameContext:
         ]
 
 
+@dataclass(slots=True)
+class TurnContext:
+    """Contexte réduit au tour en cours, pour les stratégies qui n'ont pas besoin du reste du jeu"""
+    turn_state: TurnState
+    current_player: Player
+    turn_number: int
+
+
+# Clés de comparaison des tuiles et des joueurs, partagées plutôt que recréées (lambda)
+# à chaque décision
+_tile_value = attrgetter("value")
+_tile_worms = attrgetter("worms")
+_player_score = methodcaller("get_score")
+
+
+
+def _steal_worms(entry: Tuple[Tile, Player]) -> int:
+    """Vers de la tuile d'une entrée (tuile, propriétaire) de stealable_tiles"""
+    return entry[0].worms
+
+
+def _best_worms_tile(
+    context: GameContext, steal_factor: float = 1, steal_bonus: float = 0
+) -> Optional[Tile]:
+    """Tuile qui rapporte le plus de vers, un vol valant vers × steal_factor + steal_bonus
+
+    Un seul passage, le centre d'abord puis les vols : à valeur égale, la première
+    tuile rencontrée est conservée.
+    """
+    best_tile, best_score = None, -1
+    for tile in context.available_center_tiles:
+        if tile.worms > best_score:
+            best_tile, best_score = tile, tile.worms
+    for tile, _ in context.stealable_tiles:
+        score = tile.worms * steal_factor + steal_bonus
+        if score > best_score:
+            best_tile, best_score = tile, score
+    return best_tile
+
+
 class GameStrategy(ABC):
     """Interface pour les stratégies de jeu avec accès complet aux informations"""
 
+    # Les stratégies dont choose_dice_value et should_continue_turn ne lisent que
+    # context.turn_state peuvent passer à False pour recevoir un TurnContext allégé
+    needs_full_context: bool = True
+
+    # Les stratégies de confiance ne modifient jamais le contexte : elles reçoivent
+    # directement les listes du jeu au lieu de copies
+    trusted: bool = False
+
+    # Pas de __dict__ pour les stratégies fournies ; une sous-classe sans __slots__
+    # retrouve un __dict__ et peut ajouter librement ses attributs
+    __slots__ = ()
+
     @abstractmethod
     def choose_dice_value(self, context: GameContext) -> Optional[DiceValue]:
         """Choisit quelle valeur de dé réserver
@@ -174,32 +383,24 @@ class GameStrategy(ABC):
 class ConservativeStrategy(GameStrategy):
     """Stratégie conservatrice : s'arrête dès qu'on peut prendre une tuile"""
 
+    needs_full_context = False
+    trusted = True
+    __slots__ = ()
+
     def choose_dice_value(self, context: GameContext) -> Optional[DiceValue]:
-        from pikomino import DiceValue
-        
         turn_state = context.turn_state
-        available_values = [
-            v for v in turn_state.current_roll if turn_state.can_reserve_value(v)
-        ]
-
-        if not available_values:
-            return None
 
         # Privilégier les vers si on n'en a pas encore
-        if DiceValue.WORM in available_values and not turn_state.has_worm():
+        if turn_state.reservable_mask() >> DiceValue.WORM and not turn_state.has_worm():
             return DiceValue.WORM
 
-        # Sinon, prendre la valeur la plus fréquente
-        value_counts = {}
-        for value in available_values:
-            value_counts[value] = turn_state.current_roll.count(value)
-
-        return max(value_counts.keys(), key=lambda v: value_counts[v])
+        # Sinon, prendre la valeur la plus fréquente (None si aucune n'est réservable)
+        return turn_state.most_frequent_value()
 
     def should_continue_turn(self, context: GameContext) -> bool:
         turn_state = context.turn_state
         # S'arrêter dès qu'on peut prendre une tuile (score >= 21 et a un ver)
-        return not (turn_state.get_total_score() >= 21 and turn_state.has_worm())
+        return not turn_state.ready_to_take
 
     def choose_target_tile(self, context: GameContext) -> Optional[Tile]:
         """Stratégie conservatrice : évite les conflits, préfère le centre"""
@@ -210,12 +411,12 @@ class ConservativeStrategy(GameStrategy):
         # Priorité 1 : Tuiles du centre (plus sûr, pas de conflit)
         if context.available_center_tiles:
             # Prendre la tuile de valeur la plus basse accessible (sécurité)
-            return min(context.available_center_tiles, key=lambda t: t.value)
+            return min(context.available_center_tiles, key=_tile_value)
         
         # Priorité 2 : Vol seulement si pas d'autre choix
         if context.stealable_tiles:
             # Choisir la tuile avec le moins de vers (moins agressive)
-            return min(context.stealable_tiles, key=lambda x: x[0].worms)[0]
+            return min(context.stealable_tiles, key=_steal_worms)[0]
             
         return None
 
@@ -223,32 +424,15 @@ class ConservativeStrategy(GameStrategy):
 class AggressiveStrategy(GameStrategy):
     """Stratégie agressive : vise les tuiles de haute valeur"""
 
-    def choose_dice_value(self, context: GameContext) -> Optional[DiceValue]:
-        from pikomino import DiceValue
-        
-        turn_state = context.turn_state
-        available_values = [
-            v for v in turn_state.current_roll if turn_state.can_reserve_value(v)
-        ]
-
-        if not available_values:
-            return None
-
-        # Privilégier les hautes valeurs et les vers
-        priority_order = [
-            DiceValue.WORM,
-            DiceValue.FIVE,
-            DiceValue.FOUR,
-            DiceValue.THREE,
-            DiceValue.TWO,
-            DiceValue.ONE,
-        ]
+    needs_full_context = False
+    trusted = True
+    __slots__ = ()
 
-        for preferred_value in priority_order:
-            if preferred_value in available_values:
-                return preferred_value
-
-        return available_values[0]
+    def choose_dice_value(self, context: GameContext) -> Optional[DiceValue]:
+        # Privilégier les hautes valeurs et les vers : l'ordre de priorité (ver, 5, ..., 1)
+        # est celui des faces décroissantes, soit le bit de poids fort du masque
+        mask = context.turn_state.reservable_mask()
+        return face_value(mask.bit_length() - 1) if mask else None
 
     def should_continue_turn(self, context: GameContext) -> bool:
         turn_state = context.turn_state
@@ -264,12 +448,12 @@ class AggressiveStrategy(GameStrategy):
         # Priorité 1 : Vol pour maximiser l'impact (enlever des vers à l'adversaire)
         if context.stealable_tiles:
             # Choisir la tuile volable avec le plus de vers
-            return max(context.stealable_tiles, key=lambda x: x[0].worms)[0]
+            return max(context.stealable_tiles, key=_steal_worms)[0]
         
         # Priorité 2 : Plus haute tuile du centre (maximum de vers)
         if context.available_center_tiles:
             # Prendre la tuile de plus haute valeur (plus de vers)
-            return max(context.available_center_tiles, key=lambda t: t.value)
+            return max(context.available_center_tiles, key=_tile_value)
             
         return None
 
@@ -277,53 +461,62 @@ class AggressiveStrategy(GameStrategy):
 class BalancedStrategy(GameStrategy):
     """Stratégie équilibrée : adapte ses choix selon le contexte"""
 
+    needs_full_context = False
+    trusted = True
+    __slots__ = ()
+
     def choose_dice_value(self, context: GameContext) -> Optional[DiceValue]:
-        from pikomino import DiceValue, Dice
-        
         turn_state = context.turn_state
-        available_values = [
-            v for v in turn_state.current_roll if turn_state.can_reserve_value(v)
-        ]
+        mask = turn_state.reservable_mask()
 
-        if not available_values:
+        if not mask:
             return None
+        remaining_dice = turn_state.remaining_dice
 
         # Privilégier les vers si pas encore de ver ET si on a encore beaucoup de dés
-        if (DiceValue.WORM in available_values and 
+        if (mask >> WORM_FACE and 
             not turn_state.has_worm() and 
-            turn_state.remaining_dice > 4):
+            remaining_dice > 4):
             return DiceValue.WORM
 
-        # Si peu de dés restants, privilégier les hautes valeurs
-        if turn_state.remaining_dice <= 3:
-            high_values = [v for v in available_values if v.value >= 4 or v == DiceValue.WORM]
-            if high_values:
-                return max(high_values, key=lambda v: Dice.get_point_value(v))
+        # Égalités départagées par la première face lancée
+        faces = turn_state.reservable_faces()
 
-        # Sinon, équilibrer fréquence et valeur
-        value_scores = {}
-        for value in available_values:
-            count = turn_state.current_roll.count(value)
-            points = Dice.get_point_value(value)
-            # Score = fréquence × valeur (équilibre les deux)
-            value_scores[value] = count * points
+        # Si peu de dés restants, privilégier les hautes valeurs (4, 5 et ver)
+        if remaining_dice <= 3:
+            best_face, best_points = 0, 0
+            for face in faces:
+                if face >= 4 and POINT_VALUE[face] > best_points:
+                    best_face, best_points = face, POINT_VALUE[face]
+            if best_face:
+                return face_value(best_face)
 
-        return max(value_scores.keys(), key=lambda v: value_scores[v])
+        # Sinon, équilibrer fréquence et valeur : score = fréquence × valeur,
+        # lu directement dans l'histogramme du lancer
+        histogram = turn_state.roll_histogram
+        best_face, best_score = 0, -1
+        for face in faces:
+            score = histogram[face] * POINT_VALUE[face]
+            if score > best_score:
+                best_face, best_score = face, score
+
+        return face_value(best_face)
 
     def should_continue_turn(self, context: GameContext) -> bool:
         turn_state = context.turn_state
-        score = turn_state.get_total_score()
+        ready = turn_state.ready_to_take
+        remaining_dice = turn_state.remaining_dice
 
         # S'arrêter si on peut prendre une tuile et qu'on a peu de dés restants
-        if score >= 21 and turn_state.has_worm() and turn_state.remaining_dice <= 2:
+        if ready and remaining_dice <= 2:
             return False
 
         # Continuer si on a encore beaucoup de dés et un score raisonnable
-        if turn_state.remaining_dice >= 4 and score < 28:
+        if remaining_dice >= 4 and turn_state.get_total_score() < 28:
             return True
 
         # Sinon, s'arrêter si on peut prendre une tuile
-        return not (score >= 21 and turn_state.has_worm())
+        return not ready
 
     def choose_target_tile(self, context: GameContext) -> Optional[Tile]:
         """Stratégie équilibrée : optimise selon la situation"""
@@ -333,45 +526,36 @@ class BalancedStrategy(GameStrategy):
             
         # Analyser la situation actuelle
         current_player_score = context.current_player.get_score()
-        opponent_scores = context.get_opponent_scores()
-        max_opponent_score = max(opponent_scores.values(), default=0)
+        max_opponent_score = context.max_opponent_score
         
         # Si on est en retard, privilégier l'aggressivité (vol)
         if current_player_score < max_opponent_score:
             if context.stealable_tiles:
                 # Voler la tuile avec le plus de vers
-                return max(context.stealable_tiles, key=lambda x: x[0].worms)[0]
+                return max(context.stealable_tiles, key=_steal_worms)[0]
         
         # Si on est en avance, privilégier la sécurité
         if current_player_score > max_opponent_score:
             if context.available_center_tiles:
-                # Prendre une tuile de valeur moyenne (équilibre sécurité/récompense)
-                sorted_tiles = sorted(context.available_center_tiles, key=lambda t: t.value)
-                mid_index = len(sorted_tiles) // 2
-                return sorted_tiles[mid_index]
-        
-        # Situation équilibrée : optimiser le rapport risque/récompense
-        all_options = []
+                # Prendre une tuile de valeur moyenne (équilibre sécurité/récompense) ;
+                # hors centre indexé, sélection partielle plutôt qu'un tri complet
+                tiles = context.available_center_tiles
+                middle = len(tiles) // 2
+                if not context.center_tiles_sorted:
+                    return nsmallest(middle + 1, tiles, key=_tile_value)[-1]
+                return tiles[middle]
         
-        # Évaluer les tuiles du centre (risque faible, récompense variable)
-        for tile in context.available_center_tiles:
-            all_options.append((tile, tile.worms, "center"))
-        
-        # Évaluer les tuiles volables (risque moyen, récompense + impact)
-        for tile, _ in context.stealable_tiles:
-            # Bonus pour l'impact psychologique du vol
-            impact_bonus = 1
-            all_options.append((tile, tile.worms + impact_bonus, "steal"))
-        
-        if all_options:
-            # Choisir l'option avec le meilleur rapport
-            return max(all_options, key=lambda x: x[1])[0]
-            
-        return None
+        # Situation équilibrée : optimiser le rapport risque/récompense, avec un bonus
+        # d'un ver pour l'impact psychologique d'un vol
+        return _best_worms_tile(context, steal_bonus=1)
 
 
 class TargetedStrategy(GameStrategy):
     """Stratégie ciblée : peut viser des joueurs ou tuiles spécifiques"""
+
+    needs_full_context = False
+    trusted = True
+    __slots__ = ("target_player_name", "min_target_value")
     
     def __init__(self, target_player_name: Optional[str] = None, min_target_value: int = 25):
         """
@@ -383,31 +567,19 @@ class TargetedStrategy(GameStrategy):
         self.min_target_value = min_target_value
 
     def choose_dice_value(self, context: GameContext) -> Optional[DiceValue]:
-        from pikomino import DiceValue
-        
         turn_state = context.turn_state
-        available_values = [
-            v for v in turn_state.current_roll if turn_state.can_reserve_value(v)
-        ]
-
-        if not available_values:
-            return None
 
         # Si on vise une tuile haute valeur, privilégier les dés de haute valeur
         score = turn_state.get_total_score()
         if score < self.min_target_value:
-            # Privilégier les vers et hautes valeurs pour atteindre l'objectif
-            priority_order = [DiceValue.WORM, DiceValue.FIVE, DiceValue.FOUR]
-            for value in priority_order:
-                if value in available_values:
-                    return value
-
-        # Stratégie classique sinon
-        value_counts = {}
-        for value in available_values:
-            value_counts[value] = turn_state.current_roll.count(value)
+            # Privilégier les vers et hautes valeurs pour atteindre l'objectif : la plus
+            # haute face réservable parmi 4, 5 et ver (bits 4 à 6 du masque)
+            high = turn_state.reservable_mask() >> 4
+            if high:
+                return face_value(high.bit_length() + 3)
 
-        return max(value_counts.keys(), key=lambda v: value_counts[v])
+        # Stratégie classique sinon (None si aucune valeur n'est réservable)
+        return turn_state.most_frequent_value()
 
     def should_continue_turn(self, context: GameContext) -> bool:
         turn_state = context.turn_state
@@ -418,7 +590,7 @@ class TargetedStrategy(GameStrategy):
             return True
             
         # S'arrêter si on peut prendre une tuile
-        return not (score >= 21 and turn_state.has_worm())
+        return not turn_state.ready_to_take
 
     def choose_target_tile(self, context: GameContext) -> Optional[Tile]:
         """Stratégie ciblée : priorité aux objectifs définis"""
@@ -432,54 +604,70 @@ class TargetedStrategy(GameStrategy):
                 if target_player.name == self.target_player_name:
                     return tile
         
-        # Priorité 2 : Cibler les tuiles de haute valeur (selon min_target_value)
-        high_value_tiles = []
-        
-        # Tuiles volables de haute valeur
+        # Priorité 2 : Cibler la tuile de plus haute valeur parmi celles qui atteignent
+        # min_target_value (volables d'abord, puis centre), sans liste intermédiaire
+        best_tile, best_value = None, self.min_target_value - 1
         for tile, _ in context.stealable_tiles:
-            if tile.value >= self.min_target_value:
-                high_value_tiles.append(tile)
+            if tile.value > best_value:
+                best_tile, best_value = tile, tile.value
+        center_tiles = context.available_center_tiles
+        if context.center_tiles_sorted:
+            # Centre par valeur croissante : seule la dernière tuile peut l'emporter
+            center_tiles = center_tiles[-1:]
+        for tile in center_tiles:
+            if tile.value > best_value:
+                best_tile, best_value = tile, tile.value
         
-        # Tuiles du centre de haute valeur
-        for tile in context.available_center_tiles:
-            if tile.value >= self.min_target_value:
-                high_value_tiles.append(tile)
-        
-        if high_value_tiles:
-            # Prendre la tuile de plus haute valeur parmi les cibles
-            return max(high_value_tiles, key=lambda t: t.value)
+        if best_tile is not None:
+            return best_tile
         
         # Priorité 3 : Comportement par défaut si pas d'objectif atteint
         if context.stealable_tiles:
-            return max(context.stealable_tiles, key=lambda x: x[0].worms)[0]
+            return max(context.stealable_tiles, key=_steal_worms)[0]
         
-        if context.available_center_tiles:
-            return max(context.available_center_tiles, key=lambda t: t.value)
+        center_tiles = context.available_center_tiles
+        if center_tiles:
+            if context.center_tiles_sorted:
+                return center_tiles[-1]
+            return max(center_tiles, key=_tile_value)
             
         return None
 
 
 class RandomStrategy(GameStrategy):
     """Stratégie complètement aléatoire : tous les choix sont faits au hasard"""
+
+    needs_full_context = False
+    trusted = True
+    __slots__ = ("continue_probability", "rng")
     
-    def __init__(self, continue_probability: float = 0.5):
+    def __init__(self, continue_probability: float = 0.5, rng: Optional[random.Random] = None):
         """
         Args:
             continue_probability: Probabilité de continuer le tour (0.0 à 1.0)
+            rng: Générateur propre à la stratégie (par défaut, l'état global de random)
         """
         self.continue_probability = continue_probability
+        self.rng = rng if rng is not None else random
 
     def choose_dice_value(self, context: GameContext) -> Optional[DiceValue]:
         turn_state = context.turn_state
-        available_values = [
-            v for v in turn_state.current_roll if turn_state.can_reserve_value(v)
-        ]
-
-        if not available_values:
+        mask = turn_state.reservable_mask()
+        if not mask:
             return None
 
-        # Choix complètement aléatoire
-        return random.choice(available_values)
+        # Choix complètement aléatoire d'un dé réservable : chaque face est tirée
+        # en proportion de son nombre de dés, sans construire la liste des dés
+        histogram = turn_state.roll_histogram
+        available = 0
+        faces = MASK_FACES[mask]
+        for face in faces:
+            available += histogram[face]
+        index = int(self.rng.random() * available)
+        for face in faces:
+            index -= histogram[face]
+            if index < 0:
+                return face_value(face)
 
     def should_continue_turn(self, context: GameContext) -> bool:
         turn_state = context.turn_state
@@ -488,11 +676,11 @@ class RandomStrategy(GameStrategy):
             return False
             
         # Si on ne peut pas encore prendre de tuile, on doit continuer
-        if turn_state.get_total_score() < 21 or not turn_state.has_worm():
+        if not turn_state.ready_to_take:
             return True
             
         # Choix aléatoire basé sur la probabilité configurée
-        return random.random() < self.continue_probability
+        return self.rng.random() < self.continue_probability
 
     def choose_target_tile(self, context: GameContext) -> Optional[Tile]:
         """Choix aléatoire de tuile parmi toutes les options disponibles"""
@@ -500,22 +688,49 @@ class RandomStrategy(GameStrategy):
         if not turn_state.has_worm():
             return None
             
-        # Rassembler toutes les tuiles possibles
-        all_options = []
-        
-        # Ajouter les tuiles du centre
-        for tile in context.available_center_tiles:
-            all_options.append(tile)
-        
-        # Ajouter les tuiles volables
-        for tile, _ in context.stealable_tiles:
-            all_options.append(tile)
-        
-        if not all_options:
+        # Choix complètement aléatoire parmi les tuiles du centre puis les tuiles
+        # volables, par indice, sans rassembler les options dans une liste
+        center_tiles = context.available_center_tiles
+        stealable_tiles = context.stealable_tiles
+        options = len(center_tiles) + len(stealable_tiles)
+        if not options:
             return None
-            
-        # Choix complètement aléatoire
-        return random.choice(all_options)
+        index = int(self.rng.random() * options)
+        if index < len(center_tiles):
+            return center_tiles[index]
+        return stealable_tiles[index - len(center_tiles)][0]
+
+
+# Seuils d'arrêt de OptimalStrategy par situation (très en retard : plus de risques,
+# en avance : plus conservateur) et par nombre de dés restants (0 à 8)
+_OPTIMAL_BASE_TARGETS = (30, 26, 23)
+_OPTIMAL_TARGETS = tuple(
+    tuple(optimal_target(base_target, remaining) for remaining in range(9))
+    for base_target in _OPTIMAL_BASE_TARGETS
+)
+
+
+def _optimal_dice_score(face: int, count: int, trailing: bool) -> float:
+    """Intérêt pour OptimalStrategy de réserver `count` dés de la face `face`"""
+    # Formule de base : (fréquence × valeur) + bonus fréquence
+    base_score = count * POINT_VALUE[face]
+    frequency_bonus = (count - 1) * 0.5
+    
+    # Adaptation selon la position dans la partie : en retard, bonus pour 5 et ver
+    position_bonus = 1 if trailing and face >= 5 else 0
+    
+    return base_score + frequency_bonus + position_bonus
+
+
+# Scores de choix des dés de OptimalStrategy, évalués une fois pour toutes :
+# [en retard][face][nombre de dés] (faces 1 à 6, 0 à 8 dés)
+_OPTIMAL_DICE_SCORES = tuple(
+    tuple(
+        tuple(_optimal_dice_score(face, count, trailing) for count in range(9))
+        for face in range(7)
+    )
+    for trailing in (False, True)
+)
 
 
 class OptimalStrategy(GameStrategy):
@@ -530,85 +745,94 @@ class OptimalStrategy(GameStrategy):
     5. Cibler la zone de rentabilité optimale (25-32)
     6. Adaptation selon l'historique et les adversaires
     """
+
+    trusted = True
+    __slots__ = ("lookahead", "_search_strategy")
+    
+    def __init__(self, lookahead: bool = False):
+        """
+        Args:
+            lookahead: Décider de relancer par recherche expectimax sur le reste du tour
+                (voir SearchStrategy) plutôt que par les seuils adaptatifs
+        """
+        self.lookahead = lookahead
+        self._search_strategy = SearchStrategy() if lookahead else None
     
     def choose_dice_value(self, context: GameContext) -> Optional[DiceValue]:
-        from pikomino import DiceValue, Dice
-        
         turn_state = context.turn_state
-        available_values = [
-            v for v in turn_state.current_roll 
-            if turn_state.can_reserve_value(v)
-        ]
+        mask = turn_state.reservable_mask()
         
-        if not available_values:
+        if not mask:
             return None
         
         # PRIORITÉ 1: Assurer un ver si pas encore obtenu (CRITIQUE)
-        if DiceValue.WORM in available_values and not turn_state.has_worm():
+        if mask >> WORM_FACE and not turn_state.has_worm():
             return DiceValue.WORM
         
+        # Égalités départagées par la première face lancée
+        faces = turn_state.reservable_faces()
+        
         # PRIORITÉ 2: Si peu de dés restants, maximiser la valeur par dé
         if turn_state.remaining_dice <= 3:
-            return max(available_values, key=lambda v: Dice.get_point_value(v))
+            best_face, best_points = 0, 0
+            for face in faces:
+                if POINT_VALUE[face] > best_points:
+                    best_face, best_points = face, POINT_VALUE[face]
+            return face_value(best_face)
         
-        # PRIORITÉ 3: Formule optimisée avec adaptation au contexte
-        scores = {}
-        for value in available_values:
-            count = turn_state.current_roll.count(value)
-            points = Dice.get_point_value(value)
-            
-            # Formule de base : (fréquence × valeur) + bonus fréquence
-            base_score = count * points
-            frequency_bonus = (count - 1) * 0.5
-            
-            # Adaptation selon la position dans la partie
-            position_bonus = 0
-            if not context.is_current_player_leading():
-                # Si on est en retard, bonus pour les hautes valeurs
-                if value in [DiceValue.WORM, DiceValue.FIVE]:
-                    position_bonus = 1
+        # PRIORITÉ 3: Formule optimisée avec adaptation au contexte, lue dans la table
+        # précalculée de la situation (en retard : bonus pour les hautes valeurs)
+        scores = _OPTIMAL_DICE_SCORES[not context.is_current_player_leading()]
+        histogram = turn_state.roll_histogram
+        best_value, best_score = None, -1
+        for value in faces:
+            score = scores[value][histogram[value]]
+            if score > best_score:
+                best_value, best_score = value, score
             
-            scores[value] = base_score + frequency_bonus + position_bonus
-            
-        return max(scores.keys(), key=lambda v: scores[v])
+        return face_value(best_value)
     
     def should_continue_turn(self, context: GameContext) -> bool:
         turn_state = context.turn_state
         score = turn_state.get_total_score()
+        remaining_dice = turn_state.remaining_dice
         
         # Contraintes de base
-        if turn_state.remaining_dice == 0:
+        if remaining_dice == 0:
             return False
             
         if score < 21 or not turn_state.has_worm():
             return True
         
-        # Adaptation selon la position dans la partie
-        opponent_scores = context.get_opponent_scores()
-        max_opponent_score = max(opponent_scores.values(), default=0)
-        current_score = context.current_player.get_score()
+        # Anticipation : comparer l'espérance exacte de la relance à celle de l'arrêt
+        if self._search_strategy is not None:
+            return self._search_strategy.should_continue_turn(context)
         
-        # Si on est très en retard, prendre plus de risques
-        if current_score < max_opponent_score - 5:
-            base_target = 30
-        # Si on est en avance, être plus conservateur
-        elif current_score > max_opponent_score + 3:
-            base_target = 23
-        else:
-            base_target = 26
-        
-        # SEUILS ADAPTATIFS basés sur l'analyse optimale ET la situation
-        if turn_state.remaining_dice >= 5:
-            target = base_target + 2
-        elif turn_state.remaining_dice >= 3:
-            target = base_target
-        elif turn_state.remaining_dice >= 2:
-            target = base_target - 3
-        else:
-            # 1 dé restant : sécuriser immédiatement
-            target = 21
-            
-        return score < target
+        # SEUILS ADAPTATIFS basés sur l'analyse optimale ET la situation (table précalculée)
+        situation = self._situation(context)
+        return score < _OPTIMAL_TARGETS[situation][min(remaining_dice, 8)]
+    
+    @staticmethod
+    def _situation(context: GameContext) -> int:
+        """Position dans la partie : très en retard (0), à égalité relative (1) ou en avance (2)"""
+        # Sans branchement : chaque seuil franchi fait monter d'une situation
+        lead = context.current_player.get_score() - context.max_opponent_score
+        return (lead >= -5) + (lead > 3)
+    
+    def compiled_turn(self, context: GameContext) -> Optional[Tuple[int, int]]:
+        """Paramètres (identifiant, cible de base) de play_turn_core pour ce tour
+
+        Les scores ne changent pas pendant la phase de dés : la situation évaluée une
+        fois en début de tour vaut pour toutes les décisions. None avec l'anticipation,
+        qui n'a pas d'équivalent compilé.
+        """
+        if self._search_strategy is not None:
+            return None
+        strategy_id = (
+            OPTIMAL_STRATEGY if context.is_current_player_leading()
+            else OPTIMAL_TRAILING_STRATEGY
+        )
+        return strategy_id, _OPTIMAL_BASE_TARGETS[self._situation(context)]
     
     def choose_target_tile(self, context: GameContext) -> Optional[Tile]:
         """Choix optimal de tuile basé sur l'analyse d'impact et le contexte"""
@@ -618,36 +842,232 @@ class OptimalStrategy(GameStrategy):
         
         # Analyser l'impact selon la position dans la partie
         current_score = context.current_player.get_score()
-        opponent_scores = context.get_opponent_scores()
-        max_opponent_score = max(opponent_scores.values(), default=0)
+        max_opponent_score = context.max_opponent_score
         is_leading = current_score >= max_opponent_score
         
-        # PRIORITÉ 1: Analyser l'impact du vol vs centre avec adaptation
-        if context.stealable_tiles and context.available_center_tiles:
-            # Calculer le meilleur vol possible
-            best_steal = max(context.stealable_tiles, key=lambda x: x[0].worms)
-            steal_impact = best_steal[0].worms * 2  # Double impact
-            
-            # Calculer la meilleure tuile du centre
-            best_center = max(context.available_center_tiles, key=lambda t: t.worms)
-            center_impact = best_center.worms
-            
-            # Ajustement selon la position : si on est en retard, favoriser le vol
-            if not is_leading:
-                steal_impact *= 1.2  # Bonus aggressivité
-            
-            # Choisir l'option avec le meilleur impact ajusté
-            if steal_impact > center_impact:
-                return best_steal[0]
-            else:
-                return best_center
-        
-        # PRIORITÉ 2: Vol si pas d'alternative au centre
-        elif context.stealable_tiles:
-            return max(context.stealable_tiles, key=lambda x: x[0].worms)[0]
-        
-        # PRIORITÉ 3: Centre par défaut
-        elif context.available_center_tiles:
-            return max(context.available_center_tiles, key=lambda t: t.worms)
+        # Impact d'un vol : double (vers gagnés et vers perdus par l'adversaire), avec
+        # un bonus d'aggressivité si on est en retard
+        steal_factor = 2 if is_leading else 2 * 1.2
         
-        return None 
\ No newline at end of file
+        # Le centre l'emporte à impact égal
+        return _best_worms_tile(context, steal_factor)
+
+
+@lru_cache(maxsize=None)
+def _roll_outcomes(dice: int, faces: Tuple[int, ...]) -> Tuple[Tuple[float, Tuple[int, ...]], ...]:
+    """Issues possibles d'un lancer de `dice` dés, vues depuis les faces encore libres
+
+    Les faces déjà utilisées sont regroupées : seules comptent les quantités de
+    chaque face libre. Retourne des paires (probabilité, quantités par face libre).
+    """
+    dead_probability = (6 - len(faces)) / 6
+    outcomes = []
+
+    def split(left: int, index: int, counts: Tuple[int, ...]):
+        if index == len(faces):
+            # Les dés restants tombent sur des faces déjà utilisées
+            probability = factorial(dice) / factorial(left) * dead_probability ** left
+            for count in counts:
+                probability *= (1 / 6) ** count / factorial(count)
+            if probability > 0:  # Sans face utilisée, aucun dé ne peut tomber ailleurs
+                outcomes.append((probability, counts))
+            return
+        for count in range(left + 1):
+            split(left - count, index + 1, counts + (count,))
+
+    split(dice, 0, ())
+    return tuple(outcomes)
+
+
+class _TurnSearch:
+    """Espérance de gain d'un tour, mémorisée par état (dés restants, faces utilisées, score)
+
+    `gains[score]` est la valeur de la meilleure tuile prenable avec ce score (None si
+    aucune) et `penalty` la valeur d'un tour raté. L'état est empaqueté dans un entier
+    (score << 10 | faces utilisées << 3 | dés restants) qui sert de clé à la table.
+    """
+
+    def __init__(self, gains: Tuple[Optional[float], ...], penalty: float):
+        self.gains = gains
+        self.penalty = penalty
+        self.best_gain = max((gain for gain in gains if gain is not None), default=penalty)
+        self.memo: Dict[int, float] = {}
+
+    def stop_value(self, used_mask: int, score: int) -> float:
+        """Valeur d'un arrêt maintenant"""
+        gain = self.gains[score] if (used_mask >> WORM_FACE) & 1 else None
+        return self.penalty if gain is None else gain
+
+    def reserve_value(self, remaining: int, used_mask: int, score: int) -> float:
+        """Valeur juste après une réservation : le meilleur entre s'arrêter et relancer"""
+        stop = self.stop_value(used_mask, score)
+        if remaining == 0 or stop >= self.best_gain:
+            return stop
+        return max(stop, self.roll_value(remaining, used_mask, score))
+
+    def roll_value(self, remaining: int, used_mask: int, score: int) -> float:
+        """Espérance d'un lancer des dés restants (nœud de hasard)"""
+        key = (score << 10) | (used_mask << 3) | remaining
+        value = self.memo.get(key)
+        if value is not None:
+            return value
+
+        faces = tuple(face for face in range(6, 0, -1) if not (used_mask >> face) & 1)
+        best_gain = self.best_gain
+        value = 0.0
+        for probability, counts in _roll_outcomes(remaining, faces):
+            best = self.penalty  # Aucune face réservable : tour raté
+            # Faces ordonnées par points décroissants : les meilleurs coups d'abord
+            for face, count in zip(faces, counts):
+                if count:
+                    child = self.reserve_value(
+                        remaining - count, used_mask | (1 << face),
+                        score + POINT_VALUE[face] * count,
+                    )
+                    if child > best:
+                        best = child
+                        if best >= best_gain:
+                            break  # Coupure : aucun coup ne peut faire mieux
+            value += probability * best
+
+        self.memo[key] = value
+        return value
+
+
+class SearchStrategy(GameStrategy):
+    """
+    Stratégie par recherche expectimax sur le tour en cours.
+
+    Chaque décision compare l'espérance exacte du reste du tour pour chaque choix :
+    les lancers sont des nœuds de hasard énumérés par multinomiale, les réservations
+    et les arrêts des nœuds de choix. Une tuile vaut ses vers (le double pour un vol,
+    qui en retire autant à l'adversaire) ; un tour raté coûte la tuile du dessus.
+    Les espérances sont mémorisées par état du tour et par situation de jeu.
+    """
+
+    trusted = True
+    __slots__ = ("max_cached_searches", "_searches")
+
+    def __init__(self, max_cached_searches: int = 256):
+        """
+        Args:
+            max_cached_searches: Nombre de situations de jeu dont les recherches sont conservées
+        """
+        self.max_cached_searches = max_cached_searches
+        self._searches: Dict[Tuple, _TurnSearch] = {}
+
+    @staticmethod
+    def _tile_value(tile: Tile, stolen: bool) -> float:
+        return tile.worms * 2 if stolen else tile.worms
+
+    def _search(self, context: GameContext) -> _TurnSearch:
+        """Recherche associée à la situation de jeu (tuiles prenables et pénalité)"""
+        steals = {}
+        for player in context.all_players:
+            top_tile = player.get_top_tile()
+            if top_tile is not None and player != context.current_player:
+                steals[top_tile.value] = max(
+                    steals.get(top_tile.value, 0), self._tile_value(top_tile, True)
+                )
+        gains: List[Optional[float]] = []
+        best_center = None
+        center_worms = {tile.value: tile.worms for tile in context.tiles_center}
+        for score in range(41):
+            if score in center_worms:
+                best_center = center_worms[score]
+            options = [gain for gain in (best_center, steals.get(score)) if gain is not None]
+            gains.append(max(options) if options else None)
+        top_tile = context.current_player.get_top_tile()
+        penalty = -top_tile.worms if top_tile is not None else 0
+
+        key = (tuple(gains), penalty)
+        search = self._searches.get(key)
+        if search is None:
+            if len(self._searches) >= self.max_cached_searches:
+                self._searches.clear()
+            search = self._searches[key] = _TurnSearch(key[0], penalty)
+        return search
+
+    def choose_dice_value(self, context: GameContext) -> Optional[DiceValue]:
+        turn_state = context.turn_state
+        mask = turn_state.reservable_mask()
+        if not mask:
+            return None
+
+        search = self._search(context)
+        histogram = turn_state.roll_histogram
+        used_mask = turn_state.used_mask
+        score = turn_state.get_total_score()
+        remaining_dice = turn_state.remaining_dice
+        best_value, best_expectation = None, None
+        for value in MASK_FACES[mask]:
+            count = histogram[value]
+            expectation = search.reserve_value(
+                remaining_dice - count, used_mask | (1 << value),
+                score + POINT_VALUE[value] * count,
+            )
+            if best_expectation is None or expectation > best_expectation:
+                best_value, best_expectation = value, expectation
+        return face_value(best_value)
+
+    def should_continue_turn(self, context: GameContext) -> bool:
+        turn_state = context.turn_state
+        remaining_dice = turn_state.remaining_dice
+        if remaining_dice == 0:
+            return False
+
+        search = self._search(context)
+        used_mask = turn_state.used_mask
+        score = turn_state.get_total_score()
+        return (
+            search.roll_value(remaining_dice, used_mask, score)
+            > search.stop_value(used_mask, score)
+        )
+
+    def choose_target_tile(self, context: GameContext) -> Optional[Tile]:
+        """Prend la tuile de plus grande valeur (un vol compte double)"""
+        if not context.turn_state.has_worm():
+            return None
+
+        options = [(tile, self._tile_value(tile, True)) for tile, _ in context.stealable_tiles]
+        options += [(tile, self._tile_value(tile, False)) for tile in context.available_center_tiles]
+        if not options:
+            return None
+        # À valeur égale, la tuile la plus haute (plus difficile à obtenir pour les autres)
+        return max(options, key=lambda option: (option[1], option[0].value))[0]
+
+
+# Tuiles prenables de la situation de référence (centre complet, aucun vol) par score
+_REFERENCE_GAINS = tuple(
+    None if score < 21 else (min(score, 36) - 17) >> 2 for score in range(41)
+)
+
+
+@lru_cache(maxsize=None)
+def _reference_search(penalty: int) -> _TurnSearch:
+    """Table de politique de la situation de référence, calculée une fois par pénalité"""
+    search = _TurnSearch(_REFERENCE_GAINS, penalty)
+    search.roll_value(8, 0, 0)  # Remplit la table depuis l'état initial du tour
+    return search
+
+
+class TableStrategy(SearchStrategy):
+    """
+    Politique précalculée : la recherche expectimax de SearchStrategy, résolue une fois
+    pour toutes sur une situation de référence (centre complet, aucun vol).
+
+    Seule la pénalité d'un tour raté (la tuile du dessus du joueur) distingue les
+    tables ; chaque décision se réduit ensuite à quelques lectures de table.
+    """
+
+    needs_full_context = False
+    __slots__ = ()
+
+    def _search(self, context) -> _TurnSearch:
+        top_tile = context.current_player.get_top_tile()
+        return _reference_search(-top_tile.worms if top_tile is not None else 0)
+
+
+# Import en fin de module : pikomino importe ce module pendant son propre chargement,
+# après avoir défini ces noms ; les méthodes les lisent ainsi sans import à chaque appel
+from pikomino import DiceValue, MASK_FACES, face_value, tiles_from_values  # noqa: E402
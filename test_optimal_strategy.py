@@ -3,20 +3,20 @@
 Test et validation de la stratégie optimale
 """
 
-from pikomino import simulate_game
+from pikomino import load_kernels, simulate_game
 from strategies import (
     OptimalStrategy, ConservativeStrategy, AggressiveStrategy, 
     BalancedStrategy, TargetedStrategy, RandomStrategy
 )
+from contextlib import ExitStack
+from multiprocessing import get_context
+import os
 import statistics
 import time
 
-def comprehensive_tournament():
-    """Tournament complet entre toutes les stratégies"""
-    print("🏆 TOURNAMENT COMPLET DES STRATÉGIES")
-    print("=" * 60)
-    
-    strategies = {
+def _tournament_strategies():
+    """Stratégies du tournoi, par nom"""
+    return {
         "OptimalStrategy": OptimalStrategy(),
         "Conservative": ConservativeStrategy(),
         "Aggressive": AggressiveStrategy(), 
@@ -27,39 +27,81 @@ def comprehensive_tournament():
         "RandomCautious": RandomStrategy(0.3),
         "RandomRisky": RandomStrategy(0.7),
     }
+
+
+# Stratégies du processus courant (une instance par processus de travail)
+_strategies = None
+
+
+def _init_tournament_worker():
+    """Crée les stratégies d'un processus de travail du tournoi"""
+    global _strategies
+    _strategies = _tournament_strategies()
+    load_kernels()
+
+
+def _play_tournament_game(game_num):
+    """Joue une partie du tournoi et retourne (noms des joueurs, résultat)"""
+    # Partie à 4 joueurs (rotation pour équité)
+    strategy_names = list(_strategies.keys())
+    selected_names = strategy_names[game_num % len(strategy_names):game_num % len(strategy_names) + 4]
+    if len(selected_names) < 4:
+        selected_names.extend(strategy_names[:4 - len(selected_names)])
+    
+    selected_strategies = [_strategies[name] for name in selected_names]
+    
+    return selected_names, simulate_game(selected_names, selected_strategies)
+
+
+def comprehensive_tournament(processes=None):
+    """Tournament complet entre toutes les stratégies
+
+    Les parties sont indépendantes : elles sont réparties sur `processes` processus
+    (un par cœur par défaut), ou jouées dans le processus courant s'il n'y en a qu'un.
+    """
+    print("🏆 TOURNAMENT COMPLET DES STRATÉGIES")
+    print("=" * 60)
     
     num_games = 200  # Plus de parties pour plus de précision
-    results = {name: {"wins": 0, "scores": [], "total_tiles": []} for name in strategies}
+    results = {name: {"wins": 0, "scores": [], "total_tiles": []} for name in _tournament_strategies()}
     
     print(f"🎮 Simulation de {num_games} parties avec toutes les stratégies...")
     print("   (Cela peut prendre quelques secondes)")
     
+    # Noyaux compilés chargés avant la mesure (compilation ou relecture du cache)
+    load_kernels()
     start_time = time.time()
     
-    for game_num in range(num_games):
-        if (game_num + 1) % 50 == 0:
-            print(f"   Partie {game_num + 1}/{num_games} terminée...")
-        
-        # Partie à 4 joueurs (rotation pour équité)
-        strategy_names = list(strategies.keys())
-        selected_names = strategy_names[game_num % len(strategy_names):game_num % len(strategy_names) + 4]
-        if len(selected_names) < 4:
-            selected_names.extend(strategy_names[:4 - len(selected_names)])
-        
-        selected_strategies = [strategies[name] for name in selected_names]
-        
-        result = simulate_game(selected_names, selected_strategies)
+    if processes is None:
+        processes = os.cpu_count() or 1
+    
+    with ExitStack() as stack:
+        if processes > 1:
+            # Processus lancés par spawn : les fils de numba chargés par pikomino_core
+            # ne survivent pas proprement à un fork
+            pool = stack.enter_context(
+                get_context("spawn").Pool(processes, initializer=_init_tournament_worker)
+            )
+            chunksize = max(1, num_games // (4 * processes))
+            games = pool.imap_unordered(_play_tournament_game, range(num_games), chunksize)
+        else:
+            _init_tournament_worker()
+            games = map(_play_tournament_game, range(num_games))
         
-        # Enregistrer les résultats
-        for name in selected_names:
-            score = result["final_scores"][name]
-            tiles = result["final_tiles"][name]
-            
-            results[name]["scores"].append(score)
-            results[name]["total_tiles"].append(tiles)
+        for game_count, (selected_names, result) in enumerate(games, 1):
+            if game_count % 50 == 0:
+                print(f"   Partie {game_count}/{num_games} terminée...")
             
-            if result["winner"] == name:
-                results[name]["wins"] += 1
+            # Enregistrer les résultats
+            for name in selected_names:
+                score = result["final_scores"][name]
+                tiles = result["final_tiles"][name]
+                
+                results[name]["scores"].append(score)
+                results[name]["total_tiles"].append(tiles)
+                
+                if result["winner"] == name:
+                    results[name]["wins"] += 1
     
     elapsed = time.time() - start_time
     
@@ -1,21 +1,55 @@
 import pytest
-from unittest.mock import patch, MagicMock
+import random
+from unittest.mock import patch
 from pikomino import (
     DiceValue,
     Dice,
+    PreRolledDice,
     Tile,
     TurnResult,
     TurnState,
     Player,
     PikominoGame,
+    TILE_BY_VALUE,
+    replay_game,
+    simulate_game,
+    MASK_FACES,
+)
+from pikomino_core import (
+    AGGRESSIVE_STRATEGY,
+    BALANCED_STRATEGY,
+    CONSERVATIVE_STRATEGY,
+    DEFAULT_STRATEGY,
+    OPTIMAL_STRATEGY,
+    OPTIMAL_TRAILING_STRATEGY,
+    as_faces,
+    as_ints,
+    new_choices,
+    play_game_core,
+    play_turn_core,
+    roll_faces,
+    run_game,
+    score_from_packed,
+    simulate_games_batch,
+    simulate_turn,
+    turn_success_rate,
 )
 from strategies import (
     GameStrategy,
+    GameContext,
+    BalancedStrategy,
     ConservativeStrategy,
     AggressiveStrategy,
     RandomStrategy,
+    OptimalStrategy,
+    SearchStrategy,
+    TableStrategy,
+    TurnContext,
 )
 
+# Toutes les valeurs de dés, construites une fois pour les tests d'appartenance
+_ALL_DICE_VALUES = frozenset(DiceValue)
+
 
 class TestDiceValue:
     """Tests pour les valeurs de dés"""
@@ -29,14 +63,20 @@ class TestDiceValue:
         assert DiceValue.FIVE.value == 5
         assert DiceValue.WORM.value == 6
 
-    def test_dice_point_values(self):
+    @pytest.mark.parametrize(
+        "value,expected_points",
+        [
+            (DiceValue.ONE, 1),
+            (DiceValue.TWO, 2),
+            (DiceValue.THREE, 3),
+            (DiceValue.FOUR, 4),
+            (DiceValue.FIVE, 5),
+            (DiceValue.WORM, 5),  # Ver vaut 5 points
+        ],
+    )
+    def test_dice_point_values(self, value, expected_points):
         """Test des valeurs en points des dés"""
-        assert Dice.get_point_value(DiceValue.ONE) == 1
-        assert Dice.get_point_value(DiceValue.TWO) == 2
-        assert Dice.get_point_value(DiceValue.THREE) == 3
-        assert Dice.get_point_value(DiceValue.FOUR) == 4
-        assert Dice.get_point_value(DiceValue.FIVE) == 5
-        assert Dice.get_point_value(DiceValue.WORM) == 5  # Ver vaut 5 points
+        assert Dice.get_point_value(value) == expected_points
 
 
 class TestDice:
@@ -47,7 +87,124 @@ class TestDice:
         for _ in range(100):  # Test multiple pour vérifier la randomisation
             result = Dice.roll()
             assert isinstance(result, DiceValue)
-            assert result in list(DiceValue)
+            assert result in _ALL_DICE_VALUES
+
+    def test_dice_roll_many(self):
+        """Test du lancer de plusieurs dés en une seule tranche de la réserve"""
+        results = Dice.roll_many(100)
+        assert len(results) == 100
+        assert all(
+            type(result) is DiceValue and result in _ALL_DICE_VALUES for result in results
+        )
+
+    def test_pre_rolled_dice_faces(self):
+        """Test que la réserve pré-générée ne produit que des faces 1-6 et se recharge"""
+        dice = PreRolledDice(size=64)
+        faces = [dice.next_face() for _ in range(1000)]
+        assert set(faces) == {1, 2, 3, 4, 5, 6}
+
+
+class TestPikominoCore:
+    """Tests pour les noyaux de simulation bas niveau"""
+
+    def test_simulate_turn_default_strategy(self):
+        """Test que le noyau réserve la valeur la plus fréquente et s'arrête au seuil"""
+        # 5 x4 -> 20 points, puis ver x2 -> 30 points et arrêt (2 dés restants)
+        faces = as_faces([6, 6, 6, 5, 5, 5, 5, 1, 6, 6, 1, 2])
+        assert simulate_turn(faces, 0, 25) == (30, True, 12)
+
+    def test_simulate_turn_failed(self):
+        """Test qu'un lancer sans valeur réservable fait rater le tour"""
+        # 1 x7 réservés, puis le dernier dé montre encore 1 : tour raté
+        faces = as_faces([1, 1, 1, 1, 1, 1, 1, 2, 1])
+        score, has_worm, cursor = simulate_turn(faces, 0, 50)
+        assert (score, has_worm, cursor) == (0, False, 9)
+
+    def test_play_turn_core_strategies(self):
+        """Test des choix de la phase de dés compilée selon la stratégie"""
+        faces = as_faces([6, 5, 5, 5, 5, 1, 1, 1, 5, 5, 5, 5, 4, 4, 4, 4, 4, 1])
+
+        # Conservatrice : ver d'abord, puis 5 x4 -> 25 points avec un ver, arrêt
+        choices = new_choices()
+        assert play_turn_core(faces, 0, CONSERVATIVE_STRATEGY, 21, choices) == (2, False, 15)
+        assert list(choices[:4]) == [6, 1, 5, 4]
+
+        # Agressive : plus haute face, continue jusqu'à 30 points (4 x2 -> 33)
+        choices = new_choices()
+        assert play_turn_core(faces, 0, AGGRESSIVE_STRATEGY, 30, choices) == (3, False, 18)
+        assert list(choices[:6]) == [6, 1, 5, 4, 4, 2]
+
+        # Équilibrée : fréquence × points (5 x2), ver avec 6 dés, puis 4 x2 -> 28, arrêt
+        faces = as_faces([1, 1, 1, 1, 1, 5, 5, 4, 6, 6, 4, 4, 4, 1, 4, 4, 1, 3])
+        choices = new_choices()
+        assert play_turn_core(faces, 0, BALANCED_STRATEGY, 28, choices) == (3, False, 18)
+        assert list(choices[:6]) == [5, 2, 6, 2, 4, 2]
+
+        # Optimale (cible de base 26) : ver, 5 x3 (20 points), 4 x2 -> 28 >= 23 à 2 dés
+        faces = as_faces([6, 5, 5, 5, 1, 1, 1, 1, 5, 5, 5, 4, 4, 1, 1, 4, 4, 3, 1])
+        choices = new_choices()
+        assert play_turn_core(faces, 0, OPTIMAL_STRATEGY, 26, choices) == (3, False, 19)
+        assert list(choices[:6]) == [6, 1, 5, 3, 4, 2]
+
+    def test_play_turn_core_matches_python_source(self):
+        """Test que le noyau compilé et sa version Python font les mêmes choix"""
+        # Sans numba, py_func n'existe pas : le noyau est déjà la fonction Python
+        python_turn = getattr(play_turn_core, "py_func", play_turn_core)
+        faces = roll_faces(8192, random.Random(3))
+        kernels = [
+            (DEFAULT_STRATEGY, 25), (CONSERVATIVE_STRATEGY, 21), (AGGRESSIVE_STRATEGY, 30),
+            (BALANCED_STRATEGY, 28), (OPTIMAL_STRATEGY, 26), (OPTIMAL_TRAILING_STRATEGY, 30),
+        ]
+        for strategy_id, threshold in kernels:
+            cursor = 0
+            while cursor + 36 <= len(faces):
+                compiled_choices, python_choices = new_choices(), new_choices()
+                result = play_turn_core(faces, cursor, strategy_id, threshold, compiled_choices)
+                assert python_turn(faces, cursor, strategy_id, threshold, python_choices) == result
+                assert list(compiled_choices[:2 * result[0]]) == list(python_choices[:2 * result[0]])
+                cursor = result[2]
+
+    def test_simulate_games_batch_reproducible(self):
+        """Test que chaque partie du lot ne dépend que de sa graine"""
+        strategy_ids = as_ints([CONSERVATIVE_STRATEGY, AGGRESSIVE_STRATEGY])
+        thresholds = as_ints([21, 30])
+        winners = list(simulate_games_batch(strategy_ids, thresholds, 20, 100))
+        assert set(winners) <= {0, 1}
+        assert winners[5] == run_game(strategy_ids, thresholds, 105)
+        assert winners == list(simulate_games_batch(strategy_ids, thresholds, 20, 100))
+
+    def test_play_game_core_outcome(self):
+        """Test que le bilan d'une partie compilée est cohérent avec son gagnant"""
+        strategy_ids = as_ints([CONSERVATIVE_STRATEGY, AGGRESSIVE_STRATEGY, DEFAULT_STRATEGY])
+        thresholds = as_ints([21, 30, 25])
+        outcome = as_ints([0] * 6)
+        winner = play_game_core(strategy_ids, thresholds, 7, outcome)
+        scores, tile_counts = list(outcome[:3]), list(outcome[3:])
+        assert winner == run_game(strategy_ids, thresholds, 7)
+        assert scores[winner] == max(scores)
+        assert sum(tile_counts) <= 16
+
+    def test_score_from_packed(self):
+        """Test du score calculé sur des comptes empaquetés (8 bits par face)"""
+        # 2 x un, 1 x quatre, 3 x ver -> 2 + 4 + 15
+        packed = (2 << 8) | (1 << 32) | (3 << 48)
+        assert score_from_packed(packed) == 21
+        assert score_from_packed(8 << 40) == 40
+
+    def test_turn_success_rate_bounds(self):
+        """Test que le taux de réussite estimé est une probabilité"""
+        assert 0.0 < turn_success_rate(200) < 1.0
+
+    def test_kernels_loaded_lazily(self):
+        """Test que l'import du moteur et des stratégies ne charge pas les noyaux"""
+        import subprocess
+        import sys
+
+        code = "import sys, pikomino, strategies; print('pikomino_core' in sys.modules)"
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert output.strip() == "False"
 
 
 class TestTile:
@@ -59,27 +216,14 @@ class TestTile:
         assert tile.value == 25
         assert tile.worms == 2  # Selon les règles, tuile 25 = 2 vers
 
-    def test_tile_worm_mapping(self):
+    @pytest.mark.parametrize(
+        "value,expected_worms",
+        # Tuiles 21-24 : 1 ver, 25-28 : 2 vers, 29-32 : 3 vers, 33-36 : 4 vers
+        [(value, 1 + (value - 21) // 4) for value in range(21, 37)],
+    )
+    def test_tile_worm_mapping(self, value, expected_worms):
         """Test du mapping vers/valeur selon les règles"""
-        # Tuiles 21-24 : 1 ver
-        for value in [21, 22, 23, 24]:
-            tile = Tile(value, 0)
-            assert tile.worms == 1
-
-        # Tuiles 25-28 : 2 vers
-        for value in [25, 26, 27, 28]:
-            tile = Tile(value, 0)
-            assert tile.worms == 2
-
-        # Tuiles 29-32 : 3 vers
-        for value in [29, 30, 31, 32]:
-            tile = Tile(value, 0)
-            assert tile.worms == 3
-
-        # Tuiles 33-36 : 4 vers
-        for value in [33, 34, 35, 36]:
-            tile = Tile(value, 0)
-            assert tile.worms == 4
+        assert Tile(value, 0).worms == expected_worms
 
     def test_tile_invalid_value(self):
         """Test avec valeur de tuile invalide"""
@@ -152,6 +296,61 @@ class TestTurnState:
         assert not state.can_reserve_value(DiceValue.ONE)
         assert state.can_reserve_value(DiceValue.TWO)
 
+    def test_available_counts(self):
+        """Test du comptage des valeurs réservables en une passe"""
+        state = TurnState()
+        state.current_roll = [DiceValue.ONE, DiceValue.WORM, DiceValue.ONE, DiceValue.TWO]
+        state.used_values = {DiceValue.TWO}
+
+        assert state.available_counts() == {DiceValue.ONE: 2, DiceValue.WORM: 1}
+        assert list(state.available_counts()) == [DiceValue.ONE, DiceValue.WORM]
+
+    def test_most_frequent_value(self):
+        """Test de la valeur réservable la plus fréquente"""
+        state = TurnState()
+        state.current_roll = [DiceValue.TWO, DiceValue.WORM, DiceValue.TWO, DiceValue.ONE, DiceValue.ONE]
+        state.used_values = {DiceValue.TWO}
+
+        assert state.most_frequent_value() == DiceValue.ONE
+
+        # À égalité, la première valeur lancée l'emporte
+        state.current_roll = [DiceValue.THREE, DiceValue.WORM, DiceValue.ONE, DiceValue.WORM, DiceValue.THREE]
+        state.used_values = set()
+        assert state.most_frequent_value() == DiceValue.THREE
+        state.current_roll = [DiceValue.WORM, DiceValue.THREE, DiceValue.THREE, DiceValue.WORM]
+        assert state.most_frequent_value() == DiceValue.WORM
+
+    def test_reservable_mask(self):
+        """Test du masque des faces encore réservables du lancer"""
+        state = TurnState()
+        state.current_roll = [DiceValue.ONE, DiceValue.WORM, DiceValue.FOUR]
+        state.used_values = {DiceValue.WORM}
+
+        assert state.reservable_mask() == (1 << 1) | (1 << 4)
+        assert state.current_roll_mask == (1 << 1) | (1 << 4) | (1 << 6)
+        assert state.used_mask == 1 << 6
+        assert MASK_FACES[state.reservable_mask()] == (1, 4)
+        assert state.available_values() == [DiceValue.ONE, DiceValue.FOUR]
+        assert state.reservable_faces() == [1, 4]
+
+    def test_ready_to_take(self):
+        """Test de l'indicateur tuile prenable (21 points et un ver)"""
+        state = TurnState(reserved_dice={DiceValue.FIVE: 4})
+        assert not state.ready_to_take  # 20 points sans ver
+
+        state.reserved_dice[DiceValue.WORM] = 1
+        assert state.ready_to_take
+
+    def test_roll_histogram(self):
+        """Test de l'histogramme du lancer, mis à jour à chaque nouveau lancer"""
+        state = TurnState()
+        histogram = state.roll_histogram
+        state.current_roll = [DiceValue.THREE, DiceValue.WORM, DiceValue.THREE]
+
+        assert list(histogram) == [0, 0, 0, 2, 0, 0, 1]
+        with pytest.raises(TypeError):
+            histogram[1] = 1
+
 
 class TestPlayer:
     """Tests pour la classe Player"""
@@ -160,7 +359,7 @@ class TestPlayer:
         """Test de création de joueur"""
         player = Player("Test Player")
         assert player.name == "Test Player"
-        assert player.tiles == []
+        assert player.tiles == ()
         assert player.strategy is None
 
     def test_player_score_empty(self):
@@ -207,6 +406,31 @@ class TestPlayer:
         player = Player("Test")
         assert player.remove_top_tile() is None
 
+    def test_tiles_read_only(self):
+        """Test que la pile ne se modifie pas en place (score et sommet resteraient faux)"""
+        player = Player("Test")
+        player.add_tile(Tile(21, 1))
+        with pytest.raises(AttributeError):
+            player.tiles.append(Tile(33, 4))
+
+        assert player.get_top_tile() == Tile(21, 1)
+        assert player.top_value == 21
+        assert player.get_score() == 1
+
+    def test_top_value_follows_stack(self):
+        """Test que la valeur du dessus de pile suit ajouts, retraits et affectation"""
+        player = Player("Test")
+        assert player.top_value == 0
+
+        player.tiles = [Tile(21, 1), Tile(25, 2)]
+        assert player.top_value == 25
+
+        player.add_tile(Tile(33, 4))
+        assert player.top_value == 33
+
+        player.remove_top_tile()
+        assert player.top_value == 25
+
 
 class TestGameSpecialCases:
     """Tests pour les cas particuliers du jeu selon RULES.md"""
@@ -552,6 +776,29 @@ class TestAggressiveStrategy:
         assert not strategy.should_continue_turn(turn_state, player)
 
 
+class TestBalancedStrategy:
+    """Tests pour la stratégie équilibrée"""
+
+    def test_leading_takes_median_center_tile(self):
+        """Test qu'en tête elle prend la tuile médiane du centre accessible"""
+        leader, other = Player("A", BalancedStrategy()), Player("B")
+        leader.add_tile(Tile(30, 3))
+        turn_state = TurnState(reserved_dice={DiceValue.WORM: 5})
+        tiles = [Tile(27, 2), Tile(21, 1), Tile(24, 1)]
+        context = GameContext(
+            turn_state, leader, [leader, other], tiles, [],
+            stealable_tiles=[], available_center_tiles=tiles,
+        )
+
+        assert not context.center_tiles_sorted
+        assert BalancedStrategy().choose_target_tile(context).value == 24
+
+        game = PikominoGame([leader, other])
+        context = game._build_game_context(turn_state)
+        assert context.center_tiles_sorted
+        assert BalancedStrategy().choose_target_tile(context).value == 23
+
+
 class TestPikominoGame:
     """Tests pour la classe PikominoGame"""
 
@@ -579,8 +826,8 @@ class TestPikominoGame:
         assert sorted(tile_values) == sorted(expected_values)
 
         # Vérifier les vers de quelques tuiles
-        tile_21 = next(t for t in game.tiles_center if t.value == 21)
-        tile_36 = next(t for t in game.tiles_center if t.value == 36)
+        tile_21 = game.tiles_center.get(21)
+        tile_36 = game.tiles_center.get(36)
 
         assert tile_21.worms == 1
         assert tile_36.worms == 4
@@ -758,6 +1005,76 @@ class TestPikominoGame:
 
         assert game.is_game_over()
 
+    def test_game_rng_reproducible(self):
+        """Test qu'une partie avec son propre générateur est reproductible"""
+
+        def play(seed):
+            players = [Player("A", ConservativeStrategy()), Player("B", AggressiveStrategy())]
+            PikominoGame(players, rng=random.Random(seed)).play_game()
+            return [[tile.value for tile in player.tiles] for player in players]
+
+        assert play(11) == play(11)
+
+    def test_global_seed_reproducible(self):
+        """Test que random.seed suffit à rejouer une partie sans générateur propre"""
+
+        def play(seed):
+            random.seed(seed)
+            players = [Player("A", OptimalStrategy()), Player("B", BalancedStrategy())]
+            PikominoGame(players).play_game()
+            return [[tile.value for tile in player.tiles] for player in players]
+
+        assert play(5) == play(5)
+
+    def test_replay_matches_simulated_game(self):
+        """Test que replay_game rejoue la partie de simulate_game, même à cheval sur
+        plusieurs recharges de la réserve de faces"""
+        names = ["A", "B", "C"]
+        strategies = [ConservativeStrategy(), BalancedStrategy(), OptimalStrategy()]
+        with patch("pikomino._GAME_DICE_SIZE", 50):
+            for seed in range(20):
+                result = simulate_game(names, strategies, seed=seed)
+                game = replay_game(names, strategies, seed=seed)
+                assert result["final_scores"] == {p.name: p.get_score() for p in game.players}
+
+    def test_center_mask(self):
+        """Test du masque des tuiles du centre (bit i : tuile 21 + i)"""
+        game = PikominoGame([Player("Test")])
+        assert game.center_mask == 0xFFFF
+
+        game.tiles_center.remove(game.tiles_center[-1])  # Tuile 36
+        assert game.center_mask == 0x7FFF
+
+    def test_game_context_reused_between_turns(self):
+        """Test de la réutilisation en place du contexte complet d'un tour à l'autre"""
+        players = [Player("A", ConservativeStrategy()), Player("B")]
+        players[1].add_tile(Tile(25, 2))
+        game = PikominoGame(players)
+
+        first_state = TurnState(reserved_dice={DiceValue.WORM: 5})
+        context = game._build_game_context(first_state)
+        assert context.stealable_tiles == [(players[1].get_top_tile(), players[1])]
+
+        second_state = TurnState(reserved_dice={DiceValue.ONE: 1})
+        assert game._build_game_context(second_state) is context
+        assert context.turn_state is second_state
+        assert context.stealable_tiles == []
+        assert context.available_center_tiles == []
+
+    def test_context_scores_cached_until_reset(self):
+        """Test du cache des scores adverses, vidé à la réinitialisation du contexte"""
+        players = [Player("A", ConservativeStrategy()), Player("B")]
+        game = PikominoGame(players)
+        context = game._build_game_context(TurnState())
+        assert context.max_opponent_score == 0
+        assert context.is_current_player_leading()
+
+        players[1].add_tile(Tile(33, 4))
+        assert context.max_opponent_score == 0  # Scores figés pendant le tour
+        game._build_game_context(TurnState())
+        assert context.get_opponent_scores() == {"B": 4}
+        assert context.get_leading_player() is players[1]
+
     def test_get_winner(self):
         """Test de détermination du gagnant"""
         players = [Player("Alice"), Player("Bob"), Player("Charlie")]
@@ -792,6 +1109,43 @@ class TestPikominoGame:
         assert not state["game_over"]
         assert state["turn_count"] == 0
 
+    def test_get_game_state_cache(self):
+        """Test de la mémorisation de l'état du jeu entre deux mouvements"""
+        players = [Player("Alice"), Player("Bob")]
+        game = PikominoGame(players)
+
+        state = game.get_game_state()
+        again = game.get_game_state()
+        assert again == state and again is not state
+        assert again["tiles_center"] is not state["tiles_center"]
+
+        # Modifier la copie renvoyée, même en profondeur, n'affecte pas les appels suivants
+        again["current_player"] = "Nobody"
+        again["player_scores"]["Alice"] = 99
+        again["tiles_center"].append(99)
+        again["tiles_center"][0]["worms"] = 9
+        assert game.get_game_state() == state
+
+        # Prendre une tuile invalide l'état mémorisé
+        game.take_tile(game.tiles_center[0])
+        state = game.get_game_state()
+        assert state["player_scores"] == {"Alice": 1, "Bob": 0}
+        assert state["tiles_remaining"] == 15
+
+        # Changer de joueur aussi
+        game.next_player()
+        assert game.get_game_state()["current_player"] == "Bob"
+
+        # Ainsi qu'un tour raté
+        game.handle_failed_turn()
+        assert game.get_game_state()["tiles_remaining"] == 14
+
+        # Les modifications directes des piles et du centre sont aussi vues
+        players[1].add_tile(Tile(33, 4))
+        assert game.get_game_state()["player_scores"] == {"Alice": 1, "Bob": 4}
+        game.tiles_center.remove(game.tiles_center[0])
+        assert game.get_game_state()["tiles_remaining"] == 13
+
 
 class TestGameIntegration:
     """Tests d'intégration pour des scénarios de jeu complets"""
@@ -933,6 +1287,50 @@ class TestGameIntegration:
             len(game.tiles_center) == initial_center_count - 1
         )  # Tuile retirée du centre
 
+    def test_player_statistics_match_history(self):
+        """Test des statistiques d'un joueur recalculées depuis ses tours"""
+        game = PikominoGame([Player("A"), Player("B")], record_history=True, rng=random.Random(3))
+        game.play_game()
+
+        turns = game.game_history.get_player_turns("A")
+        successes = [t for t in turns if t.result == TurnResult.SUCCESS]
+        stats = game.game_history.get_player_statistics("A")
+
+        assert stats["total_turns"] == len(turns)
+        assert stats["successful_turns"] == len(successes)
+        assert stats["failed_turns"] == len(turns) - len(successes)
+        assert stats["tiles_taken"] == [t.tile_taken for t in successes if t.tile_taken]
+        assert game.game_history.get_player_statistics("Inconnu") == {}
+
+    def test_player_turns_index(self):
+        """Test de l'index des tours par joueur tenu par l'historique"""
+        game = PikominoGame([Player("A"), Player("B")], record_history=True, rng=random.Random(5))
+        game.play_game()
+        history = game.game_history
+
+        for name in ("A", "B"):
+            assert history.get_player_turns(name) == [t for t in history.turns if t.player_name == name]
+        assert history.get_player_turns("Inconnu") == []
+
+    def test_snapshots_share_unchanged_lists(self):
+        """Test du partage des valeurs inchangées entre instantanés successifs"""
+        game = PikominoGame([Player("A"), Player("B")], record_history=True, rng=random.Random(5))
+        game.play_game()
+        turns = game.game_history.turns
+
+        assert game.game_history.game_states == [t.game_state_after for t in turns]
+        for previous, turn in zip(turns, turns[1:]):
+            before = turn.game_state_before
+            assert before.center_values is previous.game_state_after.center_values
+            assert before.removed_values is previous.game_state_after.removed_values
+        final = turns[-1].game_state_after
+        assert final.players_tiles == {p.name: list(p.tiles) for p in game.players}
+        assert final.tiles_center == list(game.tiles_center)
+        assert all(tile is TILE_BY_VALUE[tile.value] for tile in final.tiles_center)
+        assert final.removed_values == bytes(tile.value for tile in game.removed_tiles)
+        with pytest.raises(AttributeError):
+            final.turn_number = 0  # Instantanés immuables
+
 
 class TestRuleComplianceEdgeCases:
     """Tests pour vérifier la conformité aux règles dans les cas limites"""
@@ -981,8 +1379,8 @@ class TestRuleComplianceEdgeCases:
         assert max(tile_values) == 36
 
         # Vérifier que plus la valeur est haute, plus il y a de vers
-        tile_21 = next(t for t in game.tiles_center if t.value == 21)
-        tile_36 = next(t for t in game.tiles_center if t.value == 36)
+        tile_21 = game.tiles_center.get(21)
+        tile_36 = game.tiles_center.get(36)
 
         assert tile_21.worms < tile_36.worms
 
@@ -1511,5 +1909,73 @@ class TestRandomStrategy:
         assert choice is None
 
 
+class TestSearchStrategy:
+    """Tests pour la stratégie par recherche expectimax"""
+
+    def _context(self, turn_state):
+        strategy = SearchStrategy()
+        game = PikominoGame([Player("Search", strategy), Player("Other")])
+        return strategy, game._build_game_context(turn_state)
+
+    def test_stops_when_best_tile_secured(self):
+        """Test qu'elle s'arrête quand la meilleure tuile est déjà acquise"""
+        turn_state = TurnState()
+        turn_state.reserved_dice = {DiceValue.WORM: 4, DiceValue.FIVE: 3, DiceValue.ONE: 1}
+        turn_state.used_values = {DiceValue.WORM, DiceValue.FIVE, DiceValue.ONE}
+        turn_state.remaining_dice = 0  # 36 points avec un ver
+        strategy, context = self._context(turn_state)
+
+        assert not strategy.should_continue_turn(context)
+        assert strategy.choose_target_tile(context).value == 36
+
+    def test_continues_without_worm(self):
+        """Test qu'elle relance tant qu'un arrêt ferait rater le tour"""
+        turn_state = TurnState()
+        turn_state.reserved_dice = {DiceValue.FIVE: 2}
+        turn_state.used_values = {DiceValue.FIVE}
+        turn_state.remaining_dice = 6
+        strategy, context = self._context(turn_state)
+
+        assert strategy.should_continue_turn(context)
+
+    def test_chooses_reservable_value(self):
+        """Test qu'elle réserve le ver, qui assure une tuile, plutôt que les deux 5"""
+        turn_state = TurnState()
+        turn_state.reserved_dice = {DiceValue.FOUR: 4}
+        turn_state.used_values = {DiceValue.FOUR}
+        turn_state.current_roll = [DiceValue.ONE, DiceValue.WORM, DiceValue.FIVE, DiceValue.FIVE]
+        turn_state.remaining_dice = 4  # 16 points sans ver
+        strategy, context = self._context(turn_state)
+
+        assert strategy.choose_dice_value(context) == DiceValue.WORM
+
+    def test_table_strategy_uses_reference_policy(self):
+        """Test que la politique précalculée relance sans ver et s'arrête à 36 points"""
+        strategy = TableStrategy()
+        player = Player("Table", strategy)
+        turn_state = TurnState()
+        turn_state.reserved_dice = {DiceValue.FIVE: 2}
+        turn_state.used_values = {DiceValue.FIVE}
+        turn_state.remaining_dice = 6
+        assert strategy.should_continue_turn(TurnContext(turn_state, player, 1))
+
+        turn_state.reserved_dice = {DiceValue.WORM: 4, DiceValue.FIVE: 3}
+        turn_state.used_values = {DiceValue.WORM, DiceValue.FIVE}
+        turn_state.remaining_dice = 1  # 35 points avec un ver
+        assert not strategy.should_continue_turn(TurnContext(turn_state, player, 1))
+
+    def test_optimal_lookahead_follows_search(self):
+        """Test que OptimalStrategy avec anticipation relance comme la recherche"""
+        turn_state = TurnState()
+        turn_state.reserved_dice = {DiceValue.WORM: 2, DiceValue.FIVE: 3}
+        turn_state.used_values = {DiceValue.WORM, DiceValue.FIVE}
+        turn_state.remaining_dice = 3  # 25 points avec un ver
+        strategy, context = self._context(turn_state)
+
+        optimal = OptimalStrategy(lookahead=True)
+        assert optimal.should_continue_turn(context) == strategy.should_continue_turn(context)
+        assert not OptimalStrategy().lookahead
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])